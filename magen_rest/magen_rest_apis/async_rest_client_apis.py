@@ -0,0 +1,487 @@
+"""Asyncio Rest Client APIs"""
+import asyncio
+import json
+import ssl
+import threading
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+import requests.auth
+import requests.exceptions
+import simplejson
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from .rest_client_apis import RestClientApis, RestRequestSpec, success_message_code
+from .rest_exception_apis import handle_specific_exception
+from .rest_exception_apis import RestReturn
+from .rest_json_codec import get_codec
+from .rest_single_flight import flight_key
+
+__author__ = "repenno@cisco.com"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__version__ = "0.1"
+__status__ = "alpha"
+
+DEFAULT_TIMEOUT = 2.0
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+class AsyncRestResponse(object):
+    """
+    Fully read aiohttp response that looks like a requests.Response, so check_util functions
+    and the exception handlers written for RestClientApis work unchanged.
+    """
+
+    def __init__(self, response, content, json_codec=None):
+        self.__json_codec = json_codec or get_codec()
+        self.status_code = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+        self.url = str(response.url)
+        self.content = content
+        self.encoding = response.charset or "utf-8"
+
+    @property
+    def text(self):
+        """Body decoded to str"""
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        """Body decoded from JSON"""
+        if self.encoding.lower().replace("-", "") == "utf8":
+            return self.__json_codec.loads(self.content)
+        return self.__json_codec.loads(self.text)
+
+    def raise_for_status(self):
+        """
+        Raise requests.exceptions.HTTPError for 4xx and 5xx responses, same as requests.Response
+
+        :rtype: void
+        """
+        if 400 <= self.status_code < 600:
+            raise requests.exceptions.HTTPError(
+                "{} Error: {} for url: {}".format(self.status_code, self.reason, self.url), response=self)
+
+
+def _to_requests_exception(err):
+    """
+    Translate aiohttp and asyncio errors into the requests exception the synchronous client would raise
+
+    :param err: aiohttp or asyncio exception
+    :return: requests exception
+    :rtype: requests.exceptions.RequestException
+    """
+    connection_timeout = getattr(aiohttp, "ConnectionTimeoutError", None)
+    if connection_timeout and isinstance(err, connection_timeout):
+        return requests.exceptions.ConnectTimeout(err)
+    if isinstance(err, (aiohttp.ServerTimeoutError, asyncio.TimeoutError)):
+        return requests.exceptions.ReadTimeout(err)
+    if isinstance(err, aiohttp.TooManyRedirects):
+        return requests.exceptions.TooManyRedirects(err)
+    if isinstance(err, aiohttp.ClientConnectionError):
+        return requests.exceptions.ConnectionError(err)
+    if isinstance(err, aiohttp.InvalidURL):
+        return requests.exceptions.InvalidURL(err)
+    return requests.exceptions.RequestException(err)
+
+
+def async_known_exceptions(func):
+    """
+    Known Exceptions decorator for coroutines.
+    aiohttp errors are translated to their requests counterpart and then mapped
+    by handle_specific_exception exactly like known_exceptions does.
+
+    :param func: coroutine function to decorate
+    :type func: Callable
+
+    :return: decorated
+    :rtype: Callable
+    """
+    async def helper(*args, **kwargs):
+        """Actual Decorator for handling known exceptions"""
+        try:
+            try:
+                return await func(*args, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                raise _to_requests_exception(err) from err
+        except (requests.exceptions.RequestException,
+                json.JSONDecodeError,
+                simplejson.scanner.JSONDecodeError) as err:
+            return handle_specific_exception(err)
+        except TypeError as err:
+            success = False
+            return RestReturn(success=success, message=err.args[0])
+    return helper
+
+
+def _check_schema(url):
+    """
+    Reject urls requests would reject before any network activity
+
+    :param url: HTTP URL
+    :type url: str
+    :rtype: void
+    """
+    scheme = urlsplit(url).scheme
+    if not scheme:
+        raise requests.exceptions.MissingSchema("Invalid URL {!r}: No schema supplied".format(url))
+    if scheme.lower() not in ("http", "https"):
+        raise requests.exceptions.InvalidSchema("No connection adapters were found for {!r}".format(url))
+
+
+def _aiohttp_auth(auth):
+    """
+    Convert requests style Basic auth to aiohttp.BasicAuth
+
+    :param auth: tuple (user, password), requests.auth.HTTPBasicAuth or aiohttp.BasicAuth
+    :rtype: aiohttp.BasicAuth
+    """
+    if auth is None or isinstance(auth, aiohttp.BasicAuth):
+        return auth
+    if isinstance(auth, requests.auth.HTTPBasicAuth):
+        return aiohttp.BasicAuth(auth.username, auth.password)
+    return aiohttp.BasicAuth(*auth)
+
+
+def _aiohttp_ssl(verify):
+    """
+    Convert requests style verify flag to aiohttp ssl argument
+
+    :param verify: True, False or path to a CA bundle
+    """
+    if verify is True:
+        return None
+    if verify is False:
+        return False
+    return ssl.create_default_context(cafile=verify)
+
+
+class AsyncRestClientApis(object):
+    """
+    Asyncio flavour of RestClientApis.
+
+    Returns the same RestReturn objects and maps errors through the same handle_specific_exception.
+    One aiohttp.ClientSession (and connection pool) is kept per event loop.
+    """
+    put_json_headers = RestClientApis.put_json_headers
+    get_json_headers = RestClientApis.get_json_headers
+    json_codec = get_codec()
+    single_flight = None
+
+    limit = 100
+    limit_per_host = 10
+    keepalive_timeout = 60.0
+
+    __sessions = dict()
+    __sessions_lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, limit=None, limit_per_host=None, keepalive_timeout=None):
+        """
+        Configure connection pooling for sessions created after this call
+
+        :param limit: total number of simultaneous connections
+        :param limit_per_host: simultaneous connections to the same host:port
+        :param keepalive_timeout: seconds an idle connection is kept open
+        :rtype: void
+        """
+        if limit is not None:
+            cls.limit = limit
+        if limit_per_host is not None:
+            cls.limit_per_host = limit_per_host
+        if keepalive_timeout is not None:
+            cls.keepalive_timeout = keepalive_timeout
+
+    @classmethod
+    def get_session(cls):
+        """
+        Session bound to the running event loop
+
+        :rtype: aiohttp.ClientSession
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for AsyncRestClientApis")
+        loop = asyncio.get_event_loop()
+        with cls.__sessions_lock:
+            for stale in [key for key in cls.__sessions if key.is_closed()]:
+                del cls.__sessions[stale]
+            session = cls.__sessions.get(loop)
+            if session is None or session.closed:
+                connector = aiohttp.TCPConnector(limit=cls.limit, limit_per_host=cls.limit_per_host,
+                                                 keepalive_timeout=cls.keepalive_timeout)
+                session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+                cls.__sessions[loop] = session
+            return session
+
+    @classmethod
+    async def close(cls):
+        """
+        Close the session bound to the running event loop
+
+        :rtype: void
+        """
+        loop = asyncio.get_event_loop()
+        with cls.__sessions_lock:
+            session = cls.__sessions.pop(loop, None)
+        if session is not None:
+            await session.close()
+
+    @staticmethod
+    async def _request(method, url, verify=True, auth=None, timeout=DEFAULT_TIMEOUT, **kwargs):
+        """
+        Send a request and read the whole body
+
+        :rtype: AsyncRestResponse
+        """
+        _check_schema(url)
+        session = AsyncRestClientApis.get_session()
+        client_timeout = aiohttp.ClientTimeout(sock_connect=timeout, sock_read=timeout)
+        async with session.request(method, url, ssl=_aiohttp_ssl(verify), auth=_aiohttp_auth(auth),
+                                   timeout=client_timeout, **kwargs) as response:
+            content = await response.read()
+            return AsyncRestResponse(response, content, AsyncRestClientApis.json_codec)
+
+    @staticmethod
+    async def http_get_and_check_success(url, check_util=None, verify=True, auth=None, timeout=DEFAULT_TIMEOUT,
+                                         headers=None):
+        """
+        This coroutine will send a GET request and check if the response is OK.
+        When AsyncRestClientApis.single_flight is set, identical GETs awaited concurrently by several tasks
+        are sent once and every caller gets the same Rest Respond Object.
+
+        :param headers: HTTP headers to add to request
+        :param timeout: Connect and read timeout for HTTP requests
+        :param auth: Basic HTTP auth
+        :param verify: Flag to provide SSL certificate verification or not
+        :param url: HTTP URL
+        :type url: str
+        :param check_util: An optional function that performs specific application level checks. The function
+            must return boolean and take response object as an argument
+        :type check_util: Callable
+
+        :return: Rest Respond Object
+        """
+        flight = AsyncRestClientApis.single_flight
+        key = None if flight is None else flight_key(url, check_util, verify, auth, headers)
+        if key is None:
+            return await AsyncRestClientApis._http_get(url, check_util, verify, auth, timeout, headers)
+        return await flight.do(key, lambda: AsyncRestClientApis._http_get(url, check_util, verify, auth, timeout,
+                                                                          headers))
+
+    @staticmethod
+    @async_known_exceptions
+    async def _http_get(url, check_util, verify, auth, timeout, headers):
+        """
+        GET request behind http_get_and_check_success
+
+        :return: Rest Respond Object
+        """
+        get_response = await AsyncRestClientApis._request("GET", url, verify=verify, auth=auth, timeout=timeout,
+                                                          headers=headers)
+        get_response.raise_for_status()
+        chunked = ("Transfer-Encoding", "chunked") in get_response.headers.items()
+        if not chunked and get_response.status_code != HTTPStatus.NO_CONTENT and get_response.text:
+            get_resp_json = get_response.json()
+        else:
+            get_resp_json = None
+        success, message, return_code = success_message_code(get_response, check_util)
+        return RestReturn(success=success, message=message, http_status=return_code, json_body=get_resp_json,
+                          response_object=get_response)
+
+    @staticmethod
+    @async_known_exceptions
+    async def http_delete_and_check_success(url, check_util=None, verify=True, auth=None, timeout=DEFAULT_TIMEOUT):
+        """
+        This coroutine performs a DELETE request
+
+        :param timeout: Connect and read timeout for HTTP requests
+        :param auth: Basic HTTP auth
+        :param check_util: An optional function that performs specific application level checks. The function
+            must return boolean and take response object as an argument
+        :param url: URL used by the DELETE request
+
+        :return: Rest Respond Object
+        """
+        delete_resp = await AsyncRestClientApis._request("DELETE", url, verify=verify, auth=auth, timeout=timeout)
+        delete_resp.raise_for_status()
+        if delete_resp.status_code != HTTPStatus.NO_CONTENT and delete_resp.text:
+            delete_resp_json = delete_resp.json()
+        else:
+            delete_resp_json = None
+        success, message, return_code = success_message_code(delete_resp, check_util)
+        return RestReturn(success=success, message=message, http_status=return_code, json_body=delete_resp_json,
+                          response_object=delete_resp)
+
+    @staticmethod
+    @async_known_exceptions
+    async def http_post_and_check_success(url, json_req, check_util=None, timeout=DEFAULT_TIMEOUT, verify=True,
+                                          location=True, auth=None, headers=put_json_headers):
+        """
+        This coroutine performs a POST request and returns the json body to the caller
+        for any further processing or validation
+
+        :param headers: HTTP headers to add to request
+        :param auth: Basic HTTP auth
+        :param location: Verify is location header is present in the response
+        :param verify: Should we verify certificates?
+        :param timeout: Request timeout
+        :param json_req: JSON to send to server
+        :param url: URL used by the POST request
+        :param check_util: An optional function that performs specific application level checks. The function
+            must return boolean and take response object as an argument
+
+        :return: Rest Respond Object
+        """
+        post_resp = await AsyncRestClientApis._request("POST", url, verify=verify, auth=auth, timeout=timeout,
+                                                       data=json_req, headers=headers)
+        post_resp.raise_for_status()
+        # When an resource is created we need the Location header properly returned
+        if location and 'Location' not in post_resp.headers:
+            success = False
+            post_resp_json = None
+            message = HTTPStatus.INTERNAL_SERVER_ERROR.phrase
+            return_code = HTTPStatus.INTERNAL_SERVER_ERROR
+        else:
+            if post_resp.status_code != HTTPStatus.NO_CONTENT and post_resp.text:
+                post_resp_json = post_resp.json()
+            else:
+                post_resp_json = None
+            success, message, return_code = success_message_code(post_resp, check_util)
+        return RestReturn(success=success, message=message, http_status=return_code, json_body=post_resp_json,
+                          response_object=post_resp)
+
+    @staticmethod
+    @async_known_exceptions
+    async def http_put_and_check_success(url, json_req, my_function=None, verify=True, headers=put_json_headers,
+                                         params=None, timeout=DEFAULT_TIMEOUT, check_util=None):
+        """
+        This coroutine performs a PUT request and returns the json body to the caller
+        for any further processing or validation
+
+        :param timeout: Request timeout
+        :param verify: Should we verify certificates?
+        :param my_function: An optional function taking the response object and returning
+            a (success, message, http_status) tuple
+        :param params: Query strings to add to request
+        :param headers: HTTP headers to add to request
+        :param json_req: JSON to send to server
+        :param url: URL used by the PUT request
+        :param check_util: An optional function that performs specific application level checks. The function
+            must return boolean and take response object as an argument
+
+        :return: Rest Respond Object
+        """
+        put_resp = await AsyncRestClientApis._request("PUT", url, verify=verify, timeout=timeout, data=json_req,
+                                                      headers=headers, params=params)
+        put_resp.raise_for_status()
+        put_resp_json = put_resp.json() if put_resp.status_code != HTTPStatus.NO_CONTENT and put_resp.text \
+            else None
+        if my_function:
+            success, message, return_code = my_function(put_resp)
+        else:
+            success, message, return_code = success_message_code(put_resp, check_util)
+        return RestReturn(success=success, http_status=return_code, message=message, json_body=put_resp_json,
+                          response_object=put_resp)
+
+    @staticmethod
+    @async_known_exceptions
+    async def http_patch_and_check_success(url, json_req, check_util=None, timeout=DEFAULT_TIMEOUT, verify=True,
+                                           auth=None, headers=put_json_headers):
+        """
+        This coroutine performs a PATCH request and returns the json body to the caller
+        for any further processing or validation
+
+        :param headers: HTTP headers to add to request
+        :param auth: Basic HTTP auth
+        :param verify: Should we verify certificates?
+        :param timeout: Request timeout
+        :param json_req: JSON to send to server
+        :param url: URL used by the PATCH request
+        :param check_util: An optional function that performs specific application level checks. The function
+            must return boolean and take response object as an argument
+
+        :return: Rest Respond Object
+        """
+        patch_resp = await AsyncRestClientApis._request("PATCH", url, verify=verify, auth=auth, timeout=timeout,
+                                                        data=json_req, headers=headers)
+        patch_resp.raise_for_status()
+        if patch_resp.status_code != HTTPStatus.NO_CONTENT and patch_resp.text:
+            patch_resp_json = patch_resp.json()
+        else:
+            patch_resp_json = None
+        success, message, return_code = success_message_code(patch_resp, check_util)
+        return RestReturn(success=success, message=message, http_status=return_code, json_body=patch_resp_json,
+                          response_object=patch_resp)
+
+    @staticmethod
+    async def http_request(spec):
+        """
+        Dispatch a RestRequestSpec to the matching coroutine
+
+        :param spec: request description
+        :type spec: RestRequestSpec
+        :return: Rest Respond Object
+        """
+        method = spec.method.upper()
+        kwargs = dict(spec.kwargs or {})
+        if spec.check_util:
+            kwargs["check_util"] = spec.check_util
+        if method == "GET":
+            return await AsyncRestClientApis.http_get_and_check_success(spec.url, **kwargs)
+        if method == "DELETE":
+            return await AsyncRestClientApis.http_delete_and_check_success(spec.url, **kwargs)
+        if method == "POST":
+            return await AsyncRestClientApis.http_post_and_check_success(spec.url, spec.body, **kwargs)
+        if method == "PUT":
+            return await AsyncRestClientApis.http_put_and_check_success(spec.url, spec.body, **kwargs)
+        if method == "PATCH":
+            return await AsyncRestClientApis.http_patch_and_check_success(spec.url, spec.body, **kwargs)
+        return RestReturn(success=False, message="Unsupported method {}".format(spec.method),
+                          http_status=HTTPStatus.BAD_REQUEST)
+
+    @staticmethod
+    async def http_gather(request_specs, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        """
+        Issue all requests concurrently, at most max_concurrency at a time.
+
+        :param request_specs: requests to issue
+        :type request_specs: list of RestRequestSpec
+        :param max_concurrency: maximum number of requests in flight
+        :type max_concurrency: int
+        :return: Rest Respond Objects in the same order as request_specs
+        :rtype: list
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def limited(spec):
+            """Run a single request under the concurrency cap"""
+            async with semaphore:
+                return await AsyncRestClientApis.http_request(spec)
+
+        return list(await asyncio.gather(*[limited(RestRequestSpec(*spec)) for spec in request_specs]))
+
+    @staticmethod
+    def http_gather_sync(request_specs, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        """
+        Blocking version of http_gather for synchronous callers such as Flask handlers.
+        Runs a private event loop that is closed afterwards.
+
+        :param request_specs: requests to issue
+        :type request_specs: list of RestRequestSpec
+        :param max_concurrency: maximum number of requests in flight
+        :type max_concurrency: int
+        :return: Rest Respond Objects in the same order as request_specs
+        :rtype: list
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            asyncio.set_event_loop(loop)
+            return loop.run_until_complete(AsyncRestClientApis.http_gather(request_specs, max_concurrency))
+        finally:
+            loop.run_until_complete(AsyncRestClientApis.close())
+            asyncio.set_event_loop(None)
+            loop.close()
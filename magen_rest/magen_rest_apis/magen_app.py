@@ -7,6 +7,8 @@ from flask import Flask
 from flask.json import JSONEncoder
 from flask_cors import CORS
 
+from .rest_json_codec import install_json_codec
+
 
 class CustomJSONEncoder(JSONEncoder):
     """Custom JSON Encoder"""
@@ -25,21 +27,35 @@ class CustomJSONEncoder(JSONEncoder):
 
 
 class MagenApp(object):
-    """Magen Flask Application using CustomJSONEncoder"""
+    """
+    Magen Flask Application using CustomJSONEncoder.
+    Responses are serialized with json_codec, the fastest installed JSON codec by default
+    """
     __instance = None
 
-    def __init__(self, template_path):
+    def __init__(self, template_path, json_codec=None):
         self.__magen = Flask(__name__, template_folder=template_path)
         self.__magen.json_encoder = CustomJSONEncoder
+        self.__json_codec = install_json_codec(self.__magen, json_codec)
         CORS(self.__magen)
 
     @classmethod
-    def get_instance(cls, template_path='templates'):
-        """Singleton get instance"""
+    def get_instance(cls, template_path='templates', json_codec=None):
+        """
+        Singleton get instance
+
+        :param template_path: Flask template folder
+        :param json_codec: JsonCodec or codec name ("orjson", "json"), used when the instance is created
+        """
         if cls.__instance is None:
-            cls.__instance = cls(template_path)
+            cls.__instance = cls(template_path, json_codec)
         return cls.__instance
 
+    @property
+    def json_codec(self):
+        """JSON codec serializing the app responses"""
+        return self.__json_codec
+
     @staticmethod
     def app_source_version(main_fname, s_dir="dev", s_file="magen_env"):
         """
@@ -0,0 +1,349 @@
+"""Per-host Circuit Breakers for Rest Client APIs"""
+import logging
+import threading
+import time
+from collections import deque
+from enum import Enum
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+import requests.exceptions
+
+from magen_logger.logger_config import LogDefaults
+
+__author__ = "repenno@cisco.com"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__version__ = "0.1"
+__status__ = "alpha"
+
+LOGGER = logging.getLogger(LogDefaults.default_log_name)
+
+FAILURE_STATUS_CODES = frozenset([HTTPStatus.INTERNAL_SERVER_ERROR, HTTPStatus.BAD_GATEWAY,
+                                  HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.GATEWAY_TIMEOUT])
+
+
+class CircuitState(Enum):
+    """States of a circuit breaker"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+    def __init__(self, host_port):
+        super().__init__("Circuit open for {}".format(host_port))
+        self.host_port = host_port
+
+
+class CircuitBreaker(object):
+    """
+    Circuit breaker for a single host:port.
+
+    CLOSED: requests flow, outcomes of the last window_size requests are recorded. Once at least
+    min_requests outcomes are known and the failure rate reaches error_threshold the circuit opens.
+    OPEN: requests are rejected without touching the network until cool_down seconds have passed.
+    HALF_OPEN: up to half_open_probes requests are let through; a success closes the circuit,
+    a failure opens it again for another cool down.
+    """
+
+    def __init__(self, host_port, window_size=20, min_requests=10, error_threshold=0.5, cool_down=30.0,
+                 half_open_probes=1, failure_status=FAILURE_STATUS_CODES):
+        """
+        :param host_port: host:port guarded by the breaker
+        :type host_port: str
+        :param window_size: number of most recent outcomes used to compute the failure rate
+        :type window_size: int
+        :param min_requests: minimum number of outcomes before the circuit may open
+        :type min_requests: int
+        :param error_threshold: failure rate (0..1) that opens the circuit
+        :type error_threshold: float
+        :param cool_down: seconds the circuit stays open before probing
+        :type cool_down: float
+        :param half_open_probes: requests let through while half open
+        :type half_open_probes: int
+        :param failure_status: response status codes counted as failures
+        :type failure_status: Iterable
+        """
+        self.__host_port = host_port
+        self.__min_requests = min_requests
+        self.__error_threshold = error_threshold
+        self.__cool_down = cool_down
+        self.__half_open_probes = half_open_probes
+        self.__failure_status = frozenset(int(status) for status in failure_status)
+        self.__outcomes = deque(maxlen=window_size)
+        self.__state = CircuitState.CLOSED
+        self.__opened_at = None
+        self.__probes = 0
+        self.__rejected = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def host_port(self):
+        """Host and port guarded by this breaker"""
+        return self.__host_port
+
+    @property
+    def state(self):
+        """Current CircuitState, moving OPEN to HALF_OPEN once the cool down is over"""
+        with self.__lock:
+            self._cool_down_elapsed()
+            return self.__state
+
+    def _cool_down_elapsed(self):
+        """Must be called with the lock held"""
+        if self.__state is CircuitState.OPEN and time.monotonic() - self.__opened_at >= self.__cool_down:
+            LOGGER.info("Circuit for %s is half open", self.host_port)
+            self.__state = CircuitState.HALF_OPEN
+            self.__probes = 0
+
+    def _open(self):
+        """Must be called with the lock held"""
+        LOGGER.warning("Circuit for %s is open", self.host_port)
+        self.__state = CircuitState.OPEN
+        self.__opened_at = time.monotonic()
+
+    def _failure_rate(self):
+        """Must be called with the lock held"""
+        if not self.__outcomes:
+            return 0.0
+        return self.__outcomes.count(False) / len(self.__outcomes)
+
+    def allow_request(self):
+        """
+        Whether a request may be sent now. A True answer while half open uses up a probe,
+        so the caller must report the outcome with record_success, record_failure or cancel.
+
+        :rtype: bool
+        """
+        with self.__lock:
+            self._cool_down_elapsed()
+            if self.__state is CircuitState.CLOSED:
+                return True
+            if self.__state is CircuitState.HALF_OPEN and self.__probes < self.__half_open_probes:
+                self.__probes += 1
+                return True
+            self.__rejected += 1
+            return False
+
+    def record_success(self):
+        """
+        Report a successful request
+
+        :rtype: void
+        """
+        with self.__lock:
+            if self.__state is CircuitState.HALF_OPEN:
+                LOGGER.info("Circuit for %s is closed", self.host_port)
+                self.__state = CircuitState.CLOSED
+                self.__outcomes.clear()
+            self.__outcomes.append(True)
+
+    def record_failure(self):
+        """
+        Report a failed request
+
+        :rtype: void
+        """
+        with self.__lock:
+            if self.__state is CircuitState.HALF_OPEN:
+                self._open()
+                return
+            self.__outcomes.append(False)
+            if self.__state is CircuitState.CLOSED and len(self.__outcomes) >= self.__min_requests \
+                    and self._failure_rate() >= self.__error_threshold:
+                self._open()
+
+    def cancel(self):
+        """
+        Report a request that was allowed but failed before reaching the network,
+        giving back its half open probe
+
+        :rtype: void
+        """
+        with self.__lock:
+            if self.__state is CircuitState.HALF_OPEN and self.__probes > 0:
+                self.__probes -= 1
+
+    def record_exception(self, err):
+        """
+        Report a request that raised, only connection errors and timeouts count as failures
+
+        :param err: requests exception
+        :rtype: void
+        """
+        if isinstance(err, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            self.record_failure()
+        else:
+            self.cancel()
+
+    def record_response(self, response):
+        """
+        Report a request that got a response, failure_status codes count as failures
+
+        :param response: HTTP response
+        :type response: requests.Response
+        :rtype: void
+        """
+        if response.status_code in self.__failure_status:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def reset(self):
+        """
+        Force the circuit closed and forget recorded outcomes
+
+        :rtype: void
+        """
+        with self.__lock:
+            self.__state = CircuitState.CLOSED
+            self.__outcomes.clear()
+            self.__opened_at = None
+            self.__probes = 0
+            self.__rejected = 0
+
+    def to_dict(self):
+        """Cast Object to Dictionary"""
+        with self.__lock:
+            self._cool_down_elapsed()
+            return {"host_port": self.host_port, "state": self.__state.value,
+                    "failure_rate": self._failure_rate(), "window": len(self.__outcomes),
+                    "rejected": self.__rejected}
+
+
+class CircuitBreakerRegistry(object):
+    """
+    Circuit breakers keyed by host:port.
+
+    Breakers are created on first use with the registry settings. Services known to ServerUrls
+    can be registered up front so their breakers are reported under the service name.
+    """
+    __instance = None
+
+    def __init__(self, **breaker_settings):
+        """
+        :param breaker_settings: keyword arguments for every CircuitBreaker, see CircuitBreaker.__init__
+        """
+        self.__breaker_settings = breaker_settings
+        self.__breakers = dict()
+        self.__services = dict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def host_port(url):
+        """
+        Breaker key for an url, the host:port it targets
+
+        :param url: HTTP URL
+        :type url: str
+        :rtype: str
+        """
+        return urlsplit(url).netloc.lower()
+
+    def breaker(self, host_port):
+        """
+        Breaker of a host:port, created if needed
+
+        :param host_port: host:port as found in ServerUrls
+        :type host_port: str
+        :rtype: CircuitBreaker
+        """
+        host_port = host_port.lower()
+        with self.__lock:
+            breaker = self.__breakers.get(host_port)
+            if breaker is None:
+                breaker = CircuitBreaker(host_port, **self.__breaker_settings)
+                self.__breakers[host_port] = breaker
+            return breaker
+
+    def breaker_for_url(self, url):
+        """
+        Breaker guarding the host of an url
+
+        :param url: HTTP URL
+        :type url: str
+        :rtype: CircuitBreaker
+        """
+        return self.breaker(self.host_port(url))
+
+    def register_service(self, service_name, host_port):
+        """
+        Name a host:port so it is reported under the service name
+
+        :param service_name: e.g. key_server
+        :param host_port: host:port of the service
+        :rtype: CircuitBreaker
+        """
+        with self.__lock:
+            self.__services[service_name] = host_port.lower()
+        return self.breaker(host_port)
+
+    def register_server_urls(self, server_urls):
+        """
+        Register every Magen service known to a ServerUrls instance
+
+        :param server_urls: Magen server urls
+        :type server_urls: ServerUrls
+        :rtype: void
+        """
+        self.register_service("ingestion_server", server_urls.ingestion_server_url_host_port)
+        self.register_service("identity_server", server_urls.identity_server_url_host_port)
+        self.register_service("key_server", server_urls.key_server_url_host_port)
+        self.register_service("policy_server", server_urls.policy_server_url_host_port)
+        self.register_service("location_server", server_urls.location_server_url_host_port)
+
+    def state(self, host_port):
+        """
+        State of the breaker for a host:port
+
+        :param host_port: host:port
+        :rtype: CircuitState
+        """
+        return self.breaker(host_port).state
+
+    def service_state(self, service_name):
+        """
+        State of the breaker for a registered service
+
+        :param service_name: name given to register_service
+        :rtype: CircuitState
+        """
+        return self.state(self.__services[service_name])
+
+    def states(self):
+        """
+        Inspection API: details of every breaker keyed by host:port,
+        with the list of service names registered for it
+
+        :rtype: dict
+        """
+        with self.__lock:
+            breakers = dict(self.__breakers)
+            services = dict(self.__services)
+        result = dict()
+        for host_port, breaker in breakers.items():
+            details = breaker.to_dict()
+            details["services"] = sorted(name for name, service_host_port in services.items()
+                                         if service_host_port == host_port)
+            result[host_port] = details
+        return result
+
+    def reset(self):
+        """
+        Close every circuit
+
+        :rtype: void
+        """
+        with self.__lock:
+            breakers = list(self.__breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton get instance"""
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
@@ -1,20 +1,48 @@
 """Rest Client APIs"""
 import json
+import logging
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 
 import requests
 import requests.exceptions
 import simplejson
+from magen_logger.logger_config import LogDefaults
 from magen_utils_apis.compare_utils import default_full_compare
 
+from .rest_circuit_breaker import CircuitOpenError
 from .rest_exception_apis import handle_specific_exception
 from .rest_exception_apis import RestReturn
+from .rest_instrumentation import RestInstrumentation
+from .rest_json_codec import get_codec
+from .rest_json_stream import DEFAULT_CHUNK_SIZE, iter_json_records
+from .rest_retry_policy import RetryPolicy
+from .rest_session_pool import RestSessionPool
+from .rest_single_flight import flight_key
 
 __author__ = "repenno@cisco.com"
 __copyright__ = "Copyright(c) 2015, Cisco Systems, Inc."
 __version__ = "0.2"
 __status__ = "alpha"
 
+LOGGER = logging.getLogger(LogDefaults.default_log_name)
+
+DEFAULT_TIMEOUT = 2.0
+
+RestRequestSpec = namedtuple("RestRequestSpec", ["method", "url", "body", "check_util", "kwargs"])
+RestRequestSpec.__new__.__defaults__ = (None, None, None)
+RestRequestSpec.__doc__ = """
+Description of a single REST request for the fan-out and batch helpers.
+
+:param method: HTTP method: GET, POST, PUT, DELETE or PATCH
+:param url: HTTP URL
+:param body: JSON string sent by POST, PUT and PATCH
+:param check_util: optional application level check, same as for the single request APIs
+:param kwargs: dict of additional keyword arguments for the single request API
+"""
+
 
 def known_exceptions(func):
     """
@@ -76,18 +104,149 @@ def success_message_code(response_obj, check_util=None):
 
 
 class RestClientApis(object):
-    """APIs for handling REST Requests"""
+    """
+    APIs for handling REST Requests.
+
+    All requests go through the shared RestSessionPool so connections to the same host are reused.
+    Timeouts default to default_timeout and retries follow retry_policy; both can be changed
+    process wide on the class or per call. Response bodies are decoded with json_codec, the fastest
+    installed JSON codec by default. Setting circuit_breakers to a CircuitBreakerRegistry
+    makes calls to a host whose circuit is open fail fast with 503 Service Unavailable. Setting
+    response_cache to a RestResponseCache makes GET requests conditional and serves fresh or
+    not modified responses from memory. Setting single_flight to a SingleFlight coalesces
+    identical concurrent GET requests.
+    """
     put_json_headers = {'content-type': 'application/json', 'Accept': 'application/json'}
     get_json_headers = {'Accept': 'application/json'}
+    get_stream_headers = {'Accept': 'application/x-ndjson, application/json'}
+
+    default_timeout = DEFAULT_TIMEOUT
+    json_codec = get_codec()
+    retry_policy = RetryPolicy()
+    circuit_breakers = None
+    response_cache = None
+    single_flight = None
 
     @staticmethod
-    @known_exceptions
-    def http_get_and_check_success(url, check_util=None, verify=True, stream=False, auth=None, timeout=2.0, hooks=None):
+    def _send(method, url, timeout=None, retry_policy=None, hooks=None, **kwargs):
         """
-        This function will send a GET request and check if the response is OK.
+        Send a request on the pooled session of the url host, retrying according to the retry policy.
+        The call is measured when instrumentation hooks are registered or given.
+
+        :param method: HTTP method
+        :param url: HTTP URL
+        :param timeout: requests timeout, defaults to RestClientApis.default_timeout
+        :param retry_policy: retry policy, defaults to RestClientApis.retry_policy
+        :type retry_policy: RetryPolicy
+        :param hooks: instrumentation hooks for this call, in addition to the RestInstrumentation ones
+        :param kwargs: additional arguments for requests.Session.request
+        :return: response of the last attempt
+        :rtype: requests.Response
+        """
+        instrumentation = RestInstrumentation.get_instance()
+        metrics = instrumentation.start(method, url, hooks)
+        if metrics is None:
+            return RestClientApis._send_attempts(method, url, timeout, retry_policy, None, kwargs)
+        try:
+            response = RestClientApis._send_attempts(method, url, timeout, retry_policy, metrics, kwargs)
+        except Exception as err:
+            metrics.error = type(err).__name__
+            raise
+        else:
+            metrics.record_response(response)
+        finally:
+            instrumentation.finish(metrics, hooks)
+        return response
+
+    @staticmethod
+    def _send_attempts(method, url, timeout, retry_policy, metrics, kwargs):
+        """
+        Attempt loop behind _send
+
+        :param metrics: metrics of the call, None when not measured
+        :type metrics: RequestMetrics
+        :rtype: requests.Response
+        """
+        policy = retry_policy or RestClientApis.retry_policy
+        timeout = RestClientApis.default_timeout if timeout is None else timeout
+        registry = RestClientApis.circuit_breakers
+        breaker = registry.breaker_for_url(url) if registry is not None else None
+        expires_at = policy.start()
+        attempt = 1
+        while True:
+            if breaker is not None and not breaker.allow_request():
+                raise CircuitOpenError(breaker.host_port)
+            if metrics is not None:
+                metrics.attempts = attempt
+            try:
+                with RestSessionPool.get_instance().session(url) as session:
+                    response = session.request(method, url, timeout=policy.attempt_timeout(timeout, expires_at),
+                                               **kwargs)
+            except requests.exceptions.RequestException as err:
+                if breaker is not None:
+                    breaker.record_exception(err)
+                delay = policy.retry_exception(method, err, attempt, expires_at)
+                if delay is None:
+                    raise
+                LOGGER.debug("%s %s failed on attempt %d (%s), retrying in %.3fs", method, url, attempt, err, delay)
+            except Exception:
+                if breaker is not None:
+                    breaker.cancel()
+                raise
+            else:
+                if breaker is not None:
+                    breaker.record_response(response)
+                delay = policy.retry_response(method, response, attempt, expires_at)
+                if delay is None:
+                    return response
+                LOGGER.debug("%s %s returned %d on attempt %d, retrying in %.3fs", method, url,
+                             response.status_code, attempt, delay)
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _decode_json(response):
+        """
+        Decode a JSON response body with RestClientApis.json_codec
+
+        :param response: HTTP response
+        :type response: requests.Response
+        """
+        encoding = response.encoding
+        if encoding is None or encoding.lower().replace("-", "") == "utf8":
+            return RestClientApis.json_codec.loads(response.content)
+        return RestClientApis.json_codec.loads(response.text)
+
+    @staticmethod
+    def _cached_return(entry, check_util=None):
+        """
+        Build the result of a GET served from the response cache
+
+        :param entry: cache entry
+        :type entry: CacheEntry
+        :param check_util: custom check, called with the cached response
+        :return: Rest Respond Object
+        """
+        success, message, return_code = success_message_code(entry.response, check_util)
+        return RestReturn(success=success, message=message, http_status=return_code,
+                          json_body=entry.json_body, response_object=entry.response)
 
-        :param hooks: Callback function to be called when a response is received.
-        :param timeout: Read timeout for HTTP requests
+    @staticmethod
+    def http_get_and_check_success(url, check_util=None, verify=True, stream=False, auth=None, timeout=None,
+                                   hooks=None, retry_policy=None, cache=None):
+        """
+        This function will send a GET request and check if the response is OK.
+        When RestClientApis.single_flight is set, identical GETs issued concurrently by several threads are
+        sent once and every caller gets the same Rest Respond Object. Requests are identical when they share
+        url, check_util, verify, auth, cache and hooks; streamed requests are never coalesced.
+
+        :param cache: Response cache for this call, defaults to RestClientApis.response_cache.
+            Not used for streamed or authenticated requests
+        :type cache: RestResponseCache
+        :param retry_policy: Retry policy for this call, defaults to RestClientApis.retry_policy
+        :param hooks: Instrumentation hook, or list of hooks, called with the RequestMetrics of this call
+        :param timeout: Read timeout for HTTP requests, defaults to RestClientApis.default_timeout
         :param auth: Basic HTTP auth
         :param stream: Whether to keep connection open in order to stream large files
         :param verify: Verify certs
@@ -101,30 +260,125 @@ class RestClientApis(object):
 
         :return: Rest Respond Object
         """
-        with requests.Session() as session:
-            chunked = False
-            get_response = session.get(url, verify=verify, stream=stream, timeout=timeout, auth=auth)
-            get_response.raise_for_status()
-            headers = get_response.headers
-            if ("Transfer-Encoding", "chunked") in headers.items():
-                chunked = True
-            if not chunked and get_response.status_code != HTTPStatus.NO_CONTENT and get_response.text:
-                get_resp_json = get_response.json()
-            else:
-                get_resp_json = None
-            success, message, return_code = success_message_code(get_response, check_util)
+        flight = RestClientApis.single_flight
+        key = None if flight is None or stream else flight_key(url, check_util, verify, auth, cache, hooks)
+        if key is None:
+            return RestClientApis._http_get(url, check_util, verify, stream, auth, timeout, retry_policy, cache,
+                                            hooks)
+        return flight.do(key, lambda: RestClientApis._http_get(url, check_util, verify, stream, auth, timeout,
+                                                               retry_policy, cache, hooks))
 
-            rest_return_obj = RestReturn(success=success, message=message, http_status=return_code,
-                                         json_body=get_resp_json,
-                                         response_object=get_response)
-            return rest_return_obj
+    @staticmethod
+    @known_exceptions
+    def _http_get(url, check_util, verify, stream, auth, timeout, retry_policy, cache, hooks):
+        """
+        GET request behind http_get_and_check_success
+
+        :return: Rest Respond Object
+        """
+        chunked = False
+        cache = RestClientApis.response_cache if cache is None else cache
+        if stream or auth is not None:
+            cache = None
+        entry = cache.get(url) if cache is not None else None
+        if entry is not None and entry.fresh:
+            cache.record(hit=True)
+            return RestClientApis._cached_return(entry, check_util)
+        get_response = RestClientApis._send("GET", url, verify=verify, stream=stream, timeout=timeout, auth=auth,
+                                            headers=entry.conditional_headers() if entry is not None else None,
+                                            retry_policy=retry_policy, hooks=hooks)
+        get_response.raise_for_status()
+        if entry is not None and get_response.status_code == HTTPStatus.NOT_MODIFIED:
+            entry.refresh(get_response)
+            cache.record(revalidated=True)
+            return RestClientApis._cached_return(entry, check_util)
+        headers = get_response.headers
+        if ("Transfer-Encoding", "chunked") in headers.items():
+            chunked = True
+        if not chunked and get_response.status_code != HTTPStatus.NO_CONTENT and get_response.text:
+            get_resp_json = RestClientApis._decode_json(get_response)
+        else:
+            get_resp_json = None
+        if cache is not None:
+            cache.record()
+            if get_response.status_code == HTTPStatus.OK and not chunked:
+                cache.store(url, get_response, get_resp_json)
+        success, message, return_code = success_message_code(get_response, check_util)
+
+        rest_return_obj = RestReturn(success=success, message=message, http_status=return_code,
+                                     json_body=get_resp_json,
+                                     response_object=get_response)
+        return rest_return_obj
+
+    @staticmethod
+    def _stream_records(response, chunk_size):
+        """
+        Generator of the records of a streamed response, releasing the connection once done
+
+        :param response: response of a GET sent with stream=True
+        :type response: requests.Response
+        :param chunk_size: size of the reads from the socket
+        :rtype: Iterator
+        """
+        content_type = response.headers.get("Content-Type", "")
+        encoding = response.encoding if "charset" in content_type.lower() else "utf-8-sig"
+        try:
+            yield from iter_json_records(response.iter_content(chunk_size), encoding)
+        finally:
+            response.close()
 
     @staticmethod
     @known_exceptions
-    def http_delete_and_check_success(url, check_util=None, verify=True, auth=None):
+    def http_get_stream_and_check_success(url, check_util=None, verify=True, auth=None, timeout=None,
+                                          retry_policy=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        This function will send a GET request for a large collection and check if the response is OK.
+        The body, NDJSON or a top-level JSON array, is not read upfront: json_body is a generator that
+        yields each record as soon as it has been received, so memory stays bounded by the largest record.
+
+        The generator raises json.JSONDecodeError on a malformed body and requests exceptions if the
+        connection fails while streaming. The connection is released once the generator is exhausted
+        or closed.
+
+        :param url: HTTP URL
+        :type url: str
+        :param check_util: An optional function that performs specific application level checks. The function
+            must return boolean and take response object as an argument. It must not read the body
+        :type check_util: Callable
+        :param verify: Flag to provide SSL certificate verification or not
+        :type verify: bool
+        :param auth: Basic HTTP auth
+        :param timeout: Read timeout for HTTP requests, defaults to RestClientApis.default_timeout
+        :param retry_policy: Retry policy for this call, defaults to RestClientApis.retry_policy
+        :param chunk_size: size of the reads from the socket
+        :type chunk_size: int
+
+        :return: Rest Respond Object
+        """
+        get_response = RestClientApis._send("GET", url, verify=verify, stream=True, timeout=timeout, auth=auth,
+                                            headers=RestClientApis.get_stream_headers, retry_policy=retry_policy)
+        get_response.raise_for_status()
+        if get_response.status_code == HTTPStatus.NO_CONTENT:
+            get_response.close()
+            records = iter(())
+        else:
+            records = RestClientApis._stream_records(get_response, chunk_size)
+        success, message, return_code = success_message_code(get_response, check_util)
+
+        rest_return_obj = RestReturn(success=success, message=message, http_status=return_code,
+                                     json_body=records,
+                                     response_object=get_response)
+        return rest_return_obj
+
+    @staticmethod
+    @known_exceptions
+    def http_delete_and_check_success(url, check_util=None, verify=True, auth=None, timeout=None,
+                                      retry_policy=None):
         """
         This function performs a DELETE request
 
+        :param retry_policy: Retry policy for this call, defaults to RestClientApis.retry_policy
+        :param timeout: Request timeout, defaults to RestClientApis.default_timeout
         :param auth: Basic HTTP auth
         :param check_util: An optional function that performs specific application level checks. The function
             must return boolean and take response object as an argument
@@ -132,39 +386,41 @@ class RestClientApis(object):
         :param url: URL used by the POST request
         :return: Rest Respond Object
         """
-        with requests.Session() as session:
-            delete_resp = session.delete(
-                url,
-                verify=verify,
-                stream=False,
-                timeout=2.0,
-                auth=auth)
-            delete_resp.raise_for_status()
-            if delete_resp.status_code != HTTPStatus.NO_CONTENT and delete_resp.text:
-                delete_resp_json = delete_resp.json()
-            else:
-                delete_resp_json = None
+        delete_resp = RestClientApis._send(
+            "DELETE",
+            url,
+            verify=verify,
+            stream=False,
+            timeout=timeout,
+            auth=auth,
+            retry_policy=retry_policy)
+        delete_resp.raise_for_status()
+        if delete_resp.status_code != HTTPStatus.NO_CONTENT and delete_resp.text:
+            delete_resp_json = RestClientApis._decode_json(delete_resp)
+        else:
+            delete_resp_json = None
 
-            success, message, return_code = success_message_code(delete_resp, check_util)
+        success, message, return_code = success_message_code(delete_resp, check_util)
 
-            rest_return_obj = RestReturn(success=success, message=message, http_status=return_code,
-                                         json_body=delete_resp_json,
-                                         response_object=delete_resp)
-            return rest_return_obj
+        rest_return_obj = RestReturn(success=success, message=message, http_status=return_code,
+                                     json_body=delete_resp_json,
+                                     response_object=delete_resp)
+        return rest_return_obj
 
     @staticmethod
     @known_exceptions
-    def http_post_and_check_success(url, json_req, check_util=None, timeout=2.0, verify=True, location=True,
-                                    auth=None, headers=put_json_headers):
+    def http_post_and_check_success(url, json_req, check_util=None, timeout=None, verify=True, location=True,
+                                    auth=None, headers=put_json_headers, retry_policy=None):
         """
         This function performs a POST request and returns the json body to the caller
         for any further processing or validation
 
+        :param retry_policy: Retry policy for this call, defaults to RestClientApis.retry_policy
         :param headers: HTTP headers to add to request
         :param auth: Basic HTTP auth
         :param location: Verify is location header is present in the response
         :param verify: Should we verify certificates?
-        :param timeout: Request timeout
+        :param timeout: Request timeout, defaults to RestClientApis.default_timeout
         :param json_req: JSON to send to server
         :param url: URL used by the POST request
         :param check_util: An optional function that performs specific application level checks. The function
@@ -172,46 +428,50 @@ class RestClientApis(object):
 
         :return: Rest Respond Object
         """
-        with requests.Session() as session:
-            post_resp = session.post(
-                url,
-                verify=verify,
-                data=json_req,
-                headers=headers,
-                stream=False,
-                timeout=timeout,
-                auth=auth)
-
-            post_resp.raise_for_status()
-            # When an resource is created we need the Location header properly returned
-            if location and 'Location' not in post_resp.headers:
-                success = False
-                post_resp_json = None
-                message = HTTPStatus.INTERNAL_SERVER_ERROR.phrase
-                return_code = HTTPStatus.INTERNAL_SERVER_ERROR
+        post_resp = RestClientApis._send(
+            "POST",
+            url,
+            verify=verify,
+            data=json_req,
+            headers=headers,
+            stream=False,
+            timeout=timeout,
+            auth=auth,
+            retry_policy=retry_policy)
+
+        post_resp.raise_for_status()
+        # When an resource is created we need the Location header properly returned
+        if location and 'Location' not in post_resp.headers:
+            success = False
+            post_resp_json = None
+            message = HTTPStatus.INTERNAL_SERVER_ERROR.phrase
+            return_code = HTTPStatus.INTERNAL_SERVER_ERROR
+        else:
+            if post_resp.status_code != HTTPStatus.NO_CONTENT and post_resp.text:
+                post_resp_json = RestClientApis._decode_json(post_resp)
             else:
-                if post_resp.status_code != HTTPStatus.NO_CONTENT and post_resp.text:
-                    post_resp_json = post_resp.json()
-                else:
-                    post_resp_json = None
+                post_resp_json = None
 
-                success, message, return_code = success_message_code(post_resp, check_util)
+            success, message, return_code = success_message_code(post_resp, check_util)
 
-            rest_return_obj = RestReturn(success=success, message=message, http_status=return_code,
-                                         json_body=post_resp_json,
-                                         response_object=post_resp)
-            return rest_return_obj
+        rest_return_obj = RestReturn(success=success, message=message, http_status=return_code,
+                                     json_body=post_resp_json,
+                                     response_object=post_resp)
+        return rest_return_obj
 
     @staticmethod
     @known_exceptions
     def http_put_and_check_success(url, json_req, my_function=None, verify=True, headers=put_json_headers,
-                                   params=None):
+                                   params=None, check_util=None, timeout=None, retry_policy=None):
         """
         This function performs a PUT request and returns the json body to the caller
         for any further processing or validation
 
+        :param retry_policy: Retry policy for this call, defaults to RestClientApis.retry_policy
+        :param timeout: Request timeout, defaults to RestClientApis.default_timeout
         :param verify:
-        :param my_function:
+        :param my_function: An optional function taking the response object and returning
+            a (success, message, http_status) tuple. Takes precedence over check_util
         :param params: Query strings to add to request
         :param headers: HTTP headers to add to request
         :param json_req: JSON to send to server
@@ -221,29 +481,28 @@ class RestClientApis(object):
 
         :return: Rest Respond Object
         """
-        with requests.Session() as session:
-            put_resp = session.put(
-                url,
-                verify=verify,
-                data=json_req,
-                headers=headers,
-                params=params,
-                stream=False,
-                timeout=2.0)
-
-            put_resp.raise_for_status()
-            post_resp_json = put_resp.json() if put_resp.status_code != HTTPStatus.NO_CONTENT and put_resp.text \
-                else None
-            if my_function:
-                success, message, return_code = my_function(put_resp)
-            else:
-                success = True
-                message = put_resp.reason
-                return_code = put_resp.status_code
-            rest_return_obj = RestReturn(success=success,
-                                         http_status=return_code,
-                                         message=message, json_body=post_resp_json)
-            return rest_return_obj
+        put_resp = RestClientApis._send(
+            "PUT",
+            url,
+            verify=verify,
+            data=json_req,
+            headers=headers,
+            params=params,
+            stream=False,
+            timeout=timeout,
+            retry_policy=retry_policy)
+
+        put_resp.raise_for_status()
+        post_resp_json = RestClientApis._decode_json(put_resp) if put_resp.status_code != HTTPStatus.NO_CONTENT and put_resp.text \
+            else None
+        if my_function:
+            success, message, return_code = my_function(put_resp)
+        else:
+            success, message, return_code = success_message_code(put_resp, check_util)
+        rest_return_obj = RestReturn(success=success,
+                                     http_status=return_code,
+                                     message=message, json_body=post_resp_json)
+        return rest_return_obj
 
     # The remaining methods in this class are for testing purposes.
     @staticmethod
@@ -254,13 +513,13 @@ class RestClientApis(object):
     @staticmethod
     @known_exceptions
     def http_post_and_compare_get_resp(url, json_req, json_resp, check_util=default_full_compare,
-                                       timeout=2.0):
+                                       timeout=None):
         """
         This function performs a POST requests, extract the Location of the created magen_resource
         from the response. Then it performs a subsequent GET to check if magen_resource was created
         and checks if the response matches the expected response.
 
-        :param timeout: Request timeout
+        :param timeout: Request timeout, defaults to RestClientApis.default_timeout
         :param check_util: A domain specific function that validates the json expected with
             the json received from the subsequent GET request.
             The function must return boolean.
@@ -280,7 +539,7 @@ class RestClientApis(object):
             if get_response_obj.success:
                 json_get_resp = get_response_obj.json_body
                 if json_get_resp:
-                    success = check_util(json.loads(json_resp), json_get_resp)
+                    success = check_util(RestClientApis.json_codec.loads(json_resp), json_get_resp)
                     message, return_code = assign_message_code(success)
                     rest_return_obj = RestReturn(success=success, http_status=return_code, message=message,
                                                  response_object=get_response_obj.response_object)
@@ -316,7 +575,7 @@ class RestClientApis(object):
         """
         post_resp_obj = RestClientApis.http_post_and_check_success(url, json_req)
         if post_resp_obj.success:
-            success = check_util(json.loads(expected_post_json_resp), post_resp_obj.json_body)
+            success = check_util(RestClientApis.json_codec.loads(expected_post_json_resp), post_resp_obj.json_body)
             message, return_code = assign_message_code(success)
             rest_return_obj = RestReturn(success=success,
                                          http_status=return_code,
@@ -345,7 +604,7 @@ class RestClientApis(object):
         get_resp_obj = RestClientApis.http_get_and_check_success(url)
         if get_resp_obj.success:
             get_resp_json = get_resp_obj.json_body
-            success = check_util(json.loads(expected_get_json_resp), get_resp_json)
+            success = check_util(RestClientApis.json_codec.loads(expected_get_json_resp), get_resp_json)
             message, return_code = assign_message_code(success)
         else:
             return get_resp_obj
@@ -416,7 +675,7 @@ class RestClientApis(object):
             if get_response_obj.success:
                 json_get_resp = get_response_obj.json_body
                 if json_get_resp:
-                    success = check_util(json.loads(json_resp), json_get_resp)
+                    success = check_util(RestClientApis.json_codec.loads(json_resp), json_get_resp)
                     message, return_code = assign_message_code(success)
                     rest_return_obj = RestReturn(success=success,
                                                  http_status=return_code,
@@ -455,7 +714,7 @@ class RestClientApis(object):
         if put_resp_obj.success:
             json_put_resp = put_resp_obj.json_body
             if json_put_resp:
-                success = check_util(json.loads(json_resp), json_put_resp)
+                success = check_util(RestClientApis.json_codec.loads(json_resp), json_put_resp)
                 message, return_code = assign_message_code(success)
                 rest_return_obj = RestReturn(success=success,
                                              http_status=return_code,
@@ -472,17 +731,18 @@ class RestClientApis(object):
 
     @staticmethod
     @known_exceptions
-    def http_patch_and_check_success(url, json_req, check_util=None, timeout=2.0, verify=True,
-                                    auth=None, headers=put_json_headers):
+    def http_patch_and_check_success(url, json_req, check_util=None, timeout=None, verify=True,
+                                     auth=None, headers=put_json_headers, retry_policy=None):
         """
         This function performs a POST request and returns the json body to the caller
         for any further processing or validation
 
+        :param retry_policy: Retry policy for this call, defaults to RestClientApis.retry_policy
         :param headers: HTTP headers to add to request
         :param auth: Basic HTTP auth
         :param location: Verify is location header is present in the response
         :param verify: Should we verify certificates?
-        :param timeout: Request timeout
+        :param timeout: Request timeout, defaults to RestClientApis.default_timeout
         :param json_req: JSON to send to server
         :param url: URL used by the POST request
         :param check_util: An optional function that performs specific application level checks. The function
@@ -490,26 +750,90 @@ class RestClientApis(object):
 
         :return: Rest Respond Object
         """
-        with requests.Session() as session:
-            post_resp = session.patch(
-                url,
-                verify=verify,
-                data=json_req,
-                headers=headers,
-                stream=False,
-                timeout=timeout,
-                auth=auth)
+        post_resp = RestClientApis._send(
+            "PATCH",
+            url,
+            verify=verify,
+            data=json_req,
+            headers=headers,
+            stream=False,
+            timeout=timeout,
+            auth=auth,
+            retry_policy=retry_policy)
+
+        post_resp.raise_for_status()
+
+        if post_resp.status_code != HTTPStatus.NO_CONTENT and post_resp.text:
+            post_resp_json = RestClientApis._decode_json(post_resp)
+        else:
+            post_resp_json = None
 
-            post_resp.raise_for_status()
+        success, message, return_code = success_message_code(post_resp, check_util)
 
-            if post_resp.status_code != HTTPStatus.NO_CONTENT and post_resp.text:
-                post_resp_json = post_resp.json()
-            else:
-                post_resp_json = None
+        rest_return_obj = RestReturn(success=success, message=message, http_status=return_code,
+                                     json_body=post_resp_json,
+                                     response_object=post_resp)
+        return rest_return_obj
 
-            success, message, return_code = success_message_code(post_resp, check_util)
+    @staticmethod
+    def http_request(spec):
+        """
+        Dispatch a RestRequestSpec to the matching request function
 
-            rest_return_obj = RestReturn(success=success, message=message, http_status=return_code,
-                                         json_body=post_resp_json,
-                                         response_object=post_resp)
-            return rest_return_obj
+        :param spec: request description
+        :type spec: RestRequestSpec
+        :return: Rest Respond Object
+        """
+        method = spec.method.upper()
+        kwargs = dict(spec.kwargs or {})
+        if spec.check_util:
+            kwargs["check_util"] = spec.check_util
+        if method == "GET":
+            return RestClientApis.http_get_and_check_success(spec.url, **kwargs)
+        if method == "DELETE":
+            return RestClientApis.http_delete_and_check_success(spec.url, **kwargs)
+        if method == "POST":
+            return RestClientApis.http_post_and_check_success(spec.url, spec.body, **kwargs)
+        if method == "PUT":
+            return RestClientApis.http_put_and_check_success(spec.url, spec.body, **kwargs)
+        if method == "PATCH":
+            return RestClientApis.http_patch_and_check_success(spec.url, spec.body, **kwargs)
+        return RestReturn(success=False, message="Unsupported method {}".format(spec.method),
+                          http_status=HTTPStatus.BAD_REQUEST)
+
+    @staticmethod
+    def _timed_request(spec):
+        """
+        Run a single request and attach the time it took to the result
+
+        :param spec: request description
+        :type spec: RestRequestSpec
+        :return: Rest Respond Object
+        """
+        start = time.perf_counter()
+        try:
+            rest_return_obj = RestClientApis.http_request(spec)
+        except Exception as err:  # one bad item must not abort the whole batch
+            rest_return_obj = handle_specific_exception(err)
+        rest_return_obj.elapsed = time.perf_counter() - start
+        return rest_return_obj
+
+    @staticmethod
+    def http_batch(requests_specs, max_workers=None):
+        """
+        Run many requests on a bounded thread pool. Connections are reused through the shared
+        RestSessionPool, so max_workers should not exceed the pool size per host.
+
+        :param requests_specs: requests to issue, RestRequestSpec or tuples in the same order
+        :type requests_specs: list
+        :param max_workers: number of worker threads, defaults to the session pool size
+        :type max_workers: int
+        :return: Rest Respond Objects in input order, each with elapsed set
+        :rtype: list
+        """
+        specs = [RestRequestSpec(*spec) for spec in requests_specs]
+        if not specs:
+            return list()
+        workers = min(max_workers or RestSessionPool.get_instance().pool_maxsize, len(specs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(RestClientApis._timed_request, specs))
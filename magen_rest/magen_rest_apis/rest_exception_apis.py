@@ -8,6 +8,7 @@ import requests.exceptions
 
 from magen_logger.logger_config import LogDefaults
 
+from .rest_circuit_breaker import CircuitOpenError
 from .rest_return_api import RestReturn
 
 __author__ = "repennor@cisco.com"
@@ -78,6 +79,18 @@ def connection_error(err):
     return rest_return_obj
 
 
+@handle_specific_exception.register(CircuitOpenError)
+def circuit_open_error(err):
+    """Handles specific exception CircuitOpenError, the request was not sent"""
+    LOGGER.warning('Circuit open. Error: %s', err)
+    success = False
+    message = HTTPStatus.SERVICE_UNAVAILABLE.phrase
+    http_status = HTTPStatus.SERVICE_UNAVAILABLE
+    rest_return_obj = RestReturn(success=success, message=message,
+                                 http_status=http_status, json_body=None, response_object=None)
+    return rest_return_obj
+
+
 @handle_specific_exception.register(requests.exceptions.InvalidSchema)
 @handle_specific_exception.register(requests.exceptions.MissingSchema)
 def invalid_missing_schema(err):
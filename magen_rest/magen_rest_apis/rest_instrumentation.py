@@ -0,0 +1,296 @@
+"""Latency and Throughput Instrumentation for Rest Client APIs"""
+import ipaddress
+import logging
+import re
+import socket
+import threading
+import time
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+from magen_logger.logger_config import LogDefaults
+
+__author__ = "repenno@cisco.com"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__version__ = "0.1"
+__status__ = "alpha"
+
+LOGGER = logging.getLogger(LogDefaults.default_log_name)
+
+ROUTE_ID_PLACEHOLDER = "<id>"
+_ID_SEGMENT = re.compile(r"^([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+                         r"|[0-9a-fA-F]{24}|\d+)$")
+
+_CURRENT = threading.local()
+
+
+def route_template(url):
+    """
+    Route of an url: its path with uuids, Mongo object ids and numbers replaced by a placeholder,
+    so calls to the same resource type are aggregated
+
+    :param url: HTTP URL
+    :type url: str
+    :rtype: str
+    """
+    path = urlsplit(url).path or "/"
+    return "/".join(ROUTE_ID_PLACEHOLDER if _ID_SEGMENT.match(segment) else segment
+                    for segment in path.split("/"))
+
+
+def current_metrics():
+    """
+    Metrics of the call in progress on this thread
+
+    :rtype: RequestMetrics
+    """
+    return getattr(_CURRENT, "metrics", None)
+
+
+class RequestMetrics(object):
+    """
+    Measurements of a single RestClientApis call, including all its retries.
+    Durations are in seconds and are None when the phase did not happen, e.g. dns and connect
+    stay None when a kept-alive connection was reused.
+    """
+
+    def __init__(self, method, url):
+        self.method = method.upper()
+        self.url = url
+        parts = urlsplit(url)
+        self.host = parts.netloc.lower()
+        self.route = route_template(url)
+        self.status = None
+        self.error = None
+        self.attempts = 0
+        self.dns = None
+        self.connect = None
+        self.ttfb = None
+        self.total = None
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.started_at = time.perf_counter()
+        self.enclosing = None
+
+    @property
+    def retries(self):
+        """Number of attempts after the first one"""
+        return max(self.attempts - 1, 0)
+
+    def add_dns(self, seconds):
+        """Account time spent resolving host names"""
+        self.dns = (self.dns or 0.0) + seconds
+
+    def add_connect(self, seconds):
+        """Account time spent establishing TCP and TLS connections"""
+        self.connect = (self.connect or 0.0) + seconds
+
+    def record_response(self, response):
+        """
+        Fill status, time to first byte and sizes from the final response
+
+        :param response: HTTP response
+        :type response: requests.Response
+        :rtype: void
+        """
+        self.status = response.status_code
+        self.ttfb = response.elapsed.total_seconds()
+        body = response.request.body if response.request is not None else None
+        self.bytes_out = len(body) if body else 0
+        if getattr(response, "_content_consumed", True):
+            self.bytes_in = len(response.content or b"")
+        else:
+            try:
+                self.bytes_in = int(response.headers.get("Content-Length", 0))
+            except ValueError:
+                self.bytes_in = 0
+
+    def to_dict(self):
+        """Cast Object to Dictionary"""
+        return {"method": self.method, "url": self.url, "host": self.host, "route": self.route,
+                "status": self.status, "error": self.error, "attempts": self.attempts, "retries": self.retries,
+                "dns": self.dns, "connect": self.connect, "ttfb": self.ttfb, "total": self.total,
+                "bytes_out": self.bytes_out, "bytes_in": self.bytes_in}
+
+
+class RestInstrumentation(object):
+    """
+    Registry of hooks receiving a RequestMetrics for every RestClientApis call.
+
+    Hooks are callables taking the RequestMetrics as only argument. They run on the calling thread once
+    the call is over, so they must be fast; exceptions they raise are logged and ignored. When no hook is
+    registered and none is passed to the call, nothing is measured.
+    """
+    __instance = None
+
+    def __init__(self):
+        self.__hooks = tuple()
+        self.__lock = threading.Lock()
+
+    @property
+    def hooks(self):
+        """Registered hooks"""
+        return self.__hooks
+
+    def add_hook(self, hook):
+        """
+        Register a hook for every call
+
+        :param hook: callable taking a RequestMetrics
+        :type hook: Callable
+        :rtype: void
+        """
+        with self.__lock:
+            if hook not in self.__hooks:
+                self.__hooks = self.__hooks + (hook,)
+
+    def remove_hook(self, hook):
+        """
+        Unregister a hook
+
+        :param hook: hook given to add_hook
+        :rtype: void
+        """
+        with self.__lock:
+            self.__hooks = tuple(registered for registered in self.__hooks if registered != hook)
+
+    def clear(self):
+        """
+        Unregister every hook
+
+        :rtype: void
+        """
+        with self.__lock:
+            self.__hooks = tuple()
+
+    @staticmethod
+    def _call_hooks(hooks):
+        """Normalize the hooks argument of a call to a tuple"""
+        if not hooks:
+            return tuple()
+        if callable(hooks):
+            return (hooks,)
+        return tuple(hooks)
+
+    def start(self, method, url, hooks=None):
+        """
+        Start measuring a call on this thread
+
+        :param method: HTTP method
+        :param url: HTTP URL
+        :param hooks: callable or iterable of callables for this call only
+        :return: metrics to fill, None when nobody listens
+        :rtype: RequestMetrics
+        """
+        if not self.__hooks and not hooks:
+            return None
+        metrics = RequestMetrics(method, url)
+        metrics.enclosing = current_metrics()
+        _CURRENT.metrics = metrics
+        return metrics
+
+    def finish(self, metrics, hooks=None):
+        """
+        Stop measuring a call and hand its metrics to the hooks
+
+        :param metrics: value returned by start()
+        :type metrics: RequestMetrics
+        :param hooks: hooks given to start()
+        :rtype: void
+        """
+        metrics.total = time.perf_counter() - metrics.started_at
+        _CURRENT.metrics, metrics.enclosing = metrics.enclosing, None
+        for hook in self.__hooks + self._call_hooks(hooks):
+            try:
+                hook(metrics)
+            except Exception as err:
+                LOGGER.error("Instrumentation hook %s failed: %s", hook, err)
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton get instance"""
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+
+def _is_ip_address(host):
+    """Whether host is a literal IP address, so there is nothing to resolve"""
+    try:
+        ipaddress.ip_address(host.strip("[]"))
+        return True
+    except ValueError:
+        return False
+
+
+class _TimedConnectionMixin(object):
+    """
+    Splits the connection set up of urllib3 connections into DNS resolution and connect
+    (TCP plus TLS handshake) for the call measured on the current thread
+    """
+
+    def _new_conn(self):
+        metrics = current_metrics()
+        host = self._dns_host
+        if metrics is None or _is_ip_address(host):
+            return super()._new_conn()
+        start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(host, self.port, 0, socket.SOCK_STREAM)
+        except OSError:
+            # let urllib3 raise its usual name resolution error
+            return super()._new_conn()
+        finally:
+            metrics.add_dns(time.perf_counter() - start)
+        error = None
+        for address in dict.fromkeys(info[4][0] for info in addresses):
+            self._dns_host = address
+            try:
+                return super()._new_conn()
+            except (ConnectTimeoutError, NewConnectionError) as err:
+                error = err
+            finally:
+                self._dns_host = host
+        raise error
+
+    def connect(self):
+        metrics = current_metrics()
+        if metrics is None:
+            return super().connect()
+        dns_before = metrics.dns or 0.0
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            metrics.add_connect(time.perf_counter() - start - ((metrics.dns or 0.0) - dns_before))
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    """HTTP connection reporting DNS and connect timings"""
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    """HTTPS connection reporting DNS and connect timings"""
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    """HTTP connection pool of TimedHTTPConnection"""
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    """HTTPS connection pool of TimedHTTPSConnection"""
+    ConnectionCls = TimedHTTPSConnection
+
+
+class InstrumentedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections report DNS and connect timings"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": TimedHTTPConnectionPool,
+                                                   "https": TimedHTTPSConnectionPool}
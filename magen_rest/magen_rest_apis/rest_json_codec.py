@@ -0,0 +1,165 @@
+"""Pluggable JSON Codecs for REST Client and Server"""
+import datetime
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__author__ = "repenno@cisco.com"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__version__ = "0.1"
+__status__ = "alpha"
+
+JSON_CODEC_EXTENSION = "magen_json_codec"
+
+
+def default_encoder(obj):
+    """
+    Encode objects JSON does not know about, same rules as CustomJSONEncoder.default:
+    datetimes become their str() and other iterables become lists
+
+    :param obj: object to encode
+    :raises TypeError: object is not serializable
+    """
+    if isinstance(obj, datetime.datetime):
+        return str(obj)
+    try:
+        iterable = iter(obj)
+    except TypeError:
+        raise TypeError("Object of type {} is not JSON serializable".format(type(obj).__name__))
+    return list(iterable)
+
+
+class JsonCodec(object):
+    """
+    Stdlib JSON codec, always available.
+
+    dumps returns text, dumpb returns UTF-8 bytes ready to be sent, loads accepts text or bytes.
+    """
+    name = "json"
+
+    def dumps(self, obj):
+        """
+        Serialize obj to a JSON string
+
+        :rtype: str
+        """
+        return json.dumps(obj, default=default_encoder, separators=(",", ":"))
+
+    def dumpb(self, obj):
+        """
+        Serialize obj to UTF-8 encoded JSON
+
+        :rtype: bytes
+        """
+        return self.dumps(obj).encode("utf-8")
+
+    def loads(self, data):
+        """
+        Deserialize a JSON document
+
+        :param data: JSON text or bytes
+        :raises json.JSONDecodeError: invalid document
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    orjson codec. Output matches JsonCodec: datetimes go through default_encoder instead of
+    orjson's ISO format, and documents orjson rejects (integers beyond 64 bits, NaN...) are
+    handed to the stdlib.
+    """
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+        self.__options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | \
+            orjson.OPT_NON_STR_KEYS
+
+    def dumpb(self, obj):
+        try:
+            return orjson.dumps(obj, default=default_encoder, option=self.__options)
+        except orjson.JSONEncodeError:
+            return JsonCodec.dumps(self, obj).encode("utf-8")
+
+    def dumps(self, obj):
+        return self.dumpb(obj).decode("utf-8")
+
+    def loads(self, data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(data)
+
+
+CODECS = {JsonCodec.name: JsonCodec, OrjsonCodec.name: OrjsonCodec}
+
+
+def get_codec(name=None):
+    """
+    Codec by name, or the fastest one installed when no name is given
+
+    :param name: "orjson" or "json"
+    :type name: str
+    :rtype: JsonCodec
+    :raises ValueError: unknown codec
+    :raises ImportError: codec backend not installed
+    """
+    if name is None:
+        name = OrjsonCodec.name if orjson is not None else JsonCodec.name
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ValueError("Unknown JSON codec {}".format(name))
+
+
+def install_json_codec(app, codec=None):
+    """
+    Make a Flask app serialize responses with a codec: RestServerApis.respond uses it and,
+    with Flask 2.2 and later, so does jsonify
+
+    :param app: Flask application
+    :type app: Flask
+    :param codec: codec or codec name, defaults to the fastest one installed
+    :return: the installed codec
+    :rtype: JsonCodec
+    """
+    if codec is None or isinstance(codec, str):
+        codec = get_codec(codec)
+    app.extensions[JSON_CODEC_EXTENSION] = codec
+    try:
+        from flask.json.provider import JSONProvider
+    except ImportError:
+        return codec
+
+    class CodecJSONProvider(JSONProvider):
+        """Flask JSON provider backed by a JsonCodec"""
+        mimetype = "application/json"
+
+        def dumps(self, obj, **kwargs):
+            return codec.dumps(obj)
+
+        def loads(self, s, **kwargs):
+            return codec.loads(s)
+
+        def response(self, *args, **kwargs):
+            obj = self._prepare_response_obj(args, kwargs)
+            return self._app.response_class(codec.dumpb(obj), mimetype=self.mimetype)
+
+    app.json = CodecJSONProvider(app)
+    return codec
+
+
+def app_json_codec(app):
+    """
+    Codec installed on a Flask app
+
+    :param app: Flask application
+    :return: codec, None when the app uses Flask's own JSON handling
+    :rtype: JsonCodec
+    """
+    return app.extensions.get(JSON_CODEC_EXTENSION)
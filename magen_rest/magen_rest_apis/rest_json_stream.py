@@ -0,0 +1,108 @@
+"""Incremental JSON parsing of streamed HTTP bodies"""
+import codecs
+import json
+import re
+
+__author__ = "repenno@cisco.com"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__version__ = "0.1"
+__status__ = "alpha"
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+_START, _NDJSON, _ARRAY_FIRST, _ARRAY_VALUE, _ARRAY_SEPARATOR, _DONE = range(6)
+
+
+class JsonRecordParser(object):
+    """
+    Push parser yielding the records of a JSON body as soon as they are complete.
+
+    A body starting with '[' is read as a top-level array and its elements are the records,
+    anything else is read as NDJSON (any whitespace separated sequence of JSON values).
+    Only the tail of the body that does not yet form a complete record is kept in memory.
+    """
+
+    def __init__(self, encoding="utf-8-sig"):
+        """
+        :param encoding: character encoding of the body, the default accepts an optional BOM
+        :type encoding: str
+        """
+        self.__text_decoder = codecs.getincrementaldecoder(encoding)()
+        self.__json_decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__state = _START
+
+    def feed(self, chunk, final=False):
+        """
+        Parse a chunk of the body
+
+        :param chunk: raw bytes received
+        :type chunk: bytes
+        :param final: no more data will follow
+        :type final: bool
+        :return: records completed by this chunk
+        :rtype: list
+        :raises json.JSONDecodeError: the body is not valid NDJSON or JSON array
+        """
+        self.__buffer += self.__text_decoder.decode(chunk, final)
+        buffer = self.__buffer
+        records = list()
+        pos = 0
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            if self.__state == _START:
+                self.__state = _NDJSON
+                if char == "[":
+                    self.__state = _ARRAY_FIRST
+                    pos += 1
+                continue
+            if self.__state == _DONE:
+                raise json.JSONDecodeError("Extra data", buffer, pos)
+            if self.__state == _ARRAY_SEPARATOR or (self.__state == _ARRAY_FIRST and char == "]"):
+                if char == "]":
+                    self.__state = _DONE
+                elif char == "," and self.__state == _ARRAY_SEPARATOR:
+                    self.__state = _ARRAY_VALUE
+                else:
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+                pos += 1
+                continue
+            try:
+                record, end = self.__json_decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break
+            if end == len(buffer) and not final:
+                # a number at the end of the buffer may continue in the next chunk
+                break
+            records.append(record)
+            pos = end
+            if self.__state != _NDJSON:
+                self.__state = _ARRAY_SEPARATOR
+        self.__buffer = buffer[pos:]
+        if final and self.__state in (_ARRAY_FIRST, _ARRAY_VALUE, _ARRAY_SEPARATOR):
+            raise json.JSONDecodeError("Unterminated array", buffer, len(buffer))
+        return records
+
+
+def iter_json_records(chunks, encoding="utf-8-sig"):
+    """
+    Yield the records of a JSON array or NDJSON body while it is being received
+
+    :param chunks: raw body chunks, e.g. requests.Response.iter_content()
+    :type chunks: Iterable
+    :param encoding: character encoding of the body
+    :type encoding: str
+    :return: generator of records
+    :rtype: Iterator
+    """
+    parser = JsonRecordParser(encoding)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.feed(b"", final=True)
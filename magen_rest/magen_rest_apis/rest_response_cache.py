@@ -0,0 +1,232 @@
+"""Client side HTTP Response Cache for Rest Client APIs"""
+import threading
+import time
+from collections import OrderedDict
+
+__author__ = "repenno@cisco.com"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__version__ = "0.1"
+__status__ = "alpha"
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_TTL = 300.0
+
+
+def parse_cache_control(headers):
+    """
+    Extract the directives relevant to a client cache from Cache-Control
+
+    :param headers: response headers
+    :type headers: requests.structures.CaseInsensitiveDict
+    :return: no_store flag and max-age in seconds (0 for no-cache, None when absent)
+    :rtype: tuple
+    """
+    no_store = False
+    max_age = None
+    for directive in headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        name = name.lower()
+        if name == "no-store":
+            no_store = True
+        elif name == "no-cache":
+            max_age = 0
+        elif name == "max-age" and max_age is None:
+            try:
+                max_age = max(int(value.strip('"')), 0)
+            except ValueError:
+                max_age = 0
+    return no_store, max_age
+
+
+class CacheEntry(object):
+    """
+    Cached GET response: decoded JSON body and the validators needed to revalidate it
+    """
+
+    def __init__(self, response, json_body):
+        """
+        :param response: response the entry is built from
+        :type response: requests.Response
+        :param json_body: decoded body of the response
+        """
+        self.response = response
+        self.json_body = json_body
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+        self.size = len(response.content or b"")
+        self.stored_at = time.monotonic()
+        self.fresh_until = self.stored_at
+        self.refresh(response)
+
+    def refresh(self, response):
+        """
+        Restart the freshness lifetime from the headers of a 200 or 304 response
+
+        :param response: response carrying Cache-Control and validators
+        :type response: requests.Response
+        :rtype: void
+        """
+        _, max_age = parse_cache_control(response.headers)
+        now = time.monotonic()
+        self.stored_at = now
+        self.fresh_until = now + (max_age or 0)
+        self.etag = response.headers.get("ETag", self.etag)
+        self.last_modified = response.headers.get("Last-Modified", self.last_modified)
+
+    @property
+    def fresh(self):
+        """Whether the entry can be served without contacting the server"""
+        return time.monotonic() < self.fresh_until
+
+    def conditional_headers(self):
+        """
+        Headers turning a GET into a conditional GET for this entry
+
+        :rtype: dict
+        """
+        headers = dict()
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class RestResponseCache(object):
+    """
+    LRU cache of GET responses keyed by URL.
+
+    Entries are evicted in least recently used order once there are more than max_entries of them or
+    their bodies add up to more than max_bytes. An entry is also dropped ttl seconds after it was last
+    stored or revalidated, whatever its validators. Only responses carrying an ETag, a Last-Modified or
+    a positive max-age are stored, never those marked no-store.
+
+    Cached JSON bodies are shared between callers and must not be modified.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES, ttl=DEFAULT_TTL):
+        """
+        :param max_entries: maximum number of cached URLs
+        :type max_entries: int
+        :param max_bytes: maximum total size of cached bodies
+        :type max_bytes: int
+        :param ttl: seconds after which an entry is dropped
+        :type ttl: float
+        """
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        self.__ttl = ttl
+        self.__entries = OrderedDict()
+        self.__size = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__revalidated = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def size(self):
+        """Total size of cached bodies in bytes"""
+        return self.__size
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def _remove(self, url):
+        """Must be called with the lock held"""
+        entry = self.__entries.pop(url, None)
+        if entry is not None:
+            self.__size -= entry.size
+
+    def get(self, url):
+        """
+        Cached entry of an url, None when absent or past its ttl
+
+        :param url: HTTP URL
+        :type url: str
+        :rtype: CacheEntry
+        """
+        with self.__lock:
+            entry = self.__entries.get(url)
+            if entry is None:
+                return None
+            if time.monotonic() - entry.stored_at >= self.__ttl:
+                self._remove(url)
+                return None
+            self.__entries.move_to_end(url)
+            return entry
+
+    def store(self, url, response, json_body):
+        """
+        Store a 200 response if its headers allow it
+
+        :param url: HTTP URL
+        :type url: str
+        :param response: response to cache
+        :type response: requests.Response
+        :param json_body: decoded body
+        :return: the new entry, None if the response was not cached
+        :rtype: CacheEntry
+        """
+        no_store, max_age = parse_cache_control(response.headers)
+        cacheable = "ETag" in response.headers or "Last-Modified" in response.headers or max_age
+        if no_store or not cacheable:
+            self.invalidate(url)
+            return None
+        entry = CacheEntry(response, json_body)
+        if entry.size > self.__max_bytes:
+            self.invalidate(url)
+            return None
+        with self.__lock:
+            self._remove(url)
+            self.__entries[url] = entry
+            self.__size += entry.size
+            while len(self.__entries) > self.__max_entries or self.__size > self.__max_bytes:
+                self._remove(next(iter(self.__entries)))
+        return entry
+
+    def record(self, hit=False, revalidated=False):
+        """
+        Update the cache statistics
+
+        :param hit: the response was served from memory without contacting the server
+        :param revalidated: the server answered 304 Not Modified
+        :rtype: void
+        """
+        with self.__lock:
+            if hit:
+                self.__hits += 1
+            elif revalidated:
+                self.__revalidated += 1
+            else:
+                self.__misses += 1
+
+    def invalidate(self, url):
+        """
+        Drop the entry of an url
+
+        :param url: HTTP URL
+        :rtype: void
+        """
+        with self.__lock:
+            self._remove(url)
+
+    def clear(self):
+        """
+        Drop every entry
+
+        :rtype: void
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+
+    def stats(self):
+        """
+        Cache statistics
+
+        :rtype: dict
+        """
+        with self.__lock:
+            return {"entries": len(self.__entries), "bytes": self.__size, "hits": self.__hits,
+                    "revalidated": self.__revalidated, "misses": self.__misses}
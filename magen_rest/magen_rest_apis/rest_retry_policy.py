@@ -0,0 +1,219 @@
+"""Retry Policy for Rest Client APIs"""
+import random
+import time
+from http import HTTPStatus
+
+import requests.exceptions
+from urllib3.exceptions import NewConnectionError
+
+__author__ = "repenno@cisco.com"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__version__ = "0.1"
+__status__ = "alpha"
+
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"])
+RETRYABLE_STATUS_CODES = frozenset([HTTPStatus.BAD_GATEWAY, HTTPStatus.SERVICE_UNAVAILABLE,
+                                    HTTPStatus.GATEWAY_TIMEOUT])
+
+
+def _request_not_sent(err):
+    """
+    True when the error happened before the request reached the server,
+    so even non-idempotent requests can be safely sent again
+
+    :param err: requests exception
+    :rtype: bool
+    """
+    if isinstance(err, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(err, requests.exceptions.ConnectionError) and err.args:
+        return isinstance(getattr(err.args[0], "reason", None), NewConnectionError)
+    return False
+
+
+class RetryPolicy(object):
+    """
+    Retry policy for a single REST call.
+
+    A call is attempted at most max_attempts times. Between attempts the client sleeps for an exponential
+    backoff (backoff_factor * 2 ** (attempt - 1), capped by max_backoff) with full jitter, or for the
+    server's Retry-After when it is shorter than max_backoff. When deadline is set it bounds the total time
+    spent on the call, including every attempt and every sleep: per-attempt timeouts are shrunk to the
+    remaining budget and no retry is started once the budget is spent.
+
+    Only idempotent methods are retried after a timeout, a dropped connection or a retryable status code,
+    unless retry_non_idempotent is set. Failures to establish the connection are always retried since the
+    request never reached the server.
+
+    The default policy performs a single attempt, which is the historical behaviour.
+    """
+
+    def __init__(self, max_attempts=1, backoff_factor=0.1, max_backoff=2.0, jitter=True,
+                 retry_on_status=RETRYABLE_STATUS_CODES, retry_non_idempotent=False, deadline=None):
+        """
+        :param max_attempts: maximum number of attempts, 1 disables retries
+        :type max_attempts: int
+        :param backoff_factor: base of the exponential backoff in seconds
+        :type backoff_factor: float
+        :param max_backoff: maximum sleep between two attempts in seconds
+        :type max_backoff: float
+        :param jitter: randomize the backoff between 0 and its computed value
+        :type jitter: bool
+        :param retry_on_status: response status codes that trigger a retry
+        :type retry_on_status: Iterable
+        :param retry_non_idempotent: also retry POST and PATCH after the request may have reached the server
+        :type retry_non_idempotent: bool
+        :param deadline: total time budget for the call in seconds, None for no budget
+        :type deadline: float
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.__max_attempts = max_attempts
+        self.__backoff_factor = backoff_factor
+        self.__max_backoff = max_backoff
+        self.__jitter = jitter
+        self.__retry_on_status = frozenset(int(status) for status in retry_on_status)
+        self.__retry_non_idempotent = retry_non_idempotent
+        self.__deadline = deadline
+
+    @property
+    def max_attempts(self):
+        """Maximum number of attempts"""
+        return self.__max_attempts
+
+    @property
+    def backoff_factor(self):
+        """Base of the exponential backoff in seconds"""
+        return self.__backoff_factor
+
+    @property
+    def max_backoff(self):
+        """Maximum sleep between two attempts in seconds"""
+        return self.__max_backoff
+
+    @property
+    def jitter(self):
+        """Whether the backoff is randomized"""
+        return self.__jitter
+
+    @property
+    def retry_on_status(self):
+        """Status codes that trigger a retry"""
+        return self.__retry_on_status
+
+    @property
+    def retry_non_idempotent(self):
+        """Whether non-idempotent methods are retried"""
+        return self.__retry_non_idempotent
+
+    @property
+    def deadline(self):
+        """Total time budget for a call in seconds"""
+        return self.__deadline
+
+    def start(self):
+        """
+        Absolute monotonic time at which the call must be finished
+
+        :return: end of the budget, None when there is no deadline
+        :rtype: float
+        """
+        return None if self.deadline is None else time.monotonic() + self.deadline
+
+    @staticmethod
+    def remaining(expires_at):
+        """
+        Time left in the budget
+
+        :param expires_at: value returned by start()
+        :return: seconds left, None when there is no deadline
+        :rtype: float
+        """
+        return None if expires_at is None else expires_at - time.monotonic()
+
+    def attempt_timeout(self, timeout, expires_at):
+        """
+        Timeout for the next attempt: the configured timeout shrunk to the remaining budget
+
+        :param timeout: requests timeout, a number or a (connect, read) tuple
+        :param expires_at: value returned by start()
+        :return: requests timeout
+        """
+        remaining = self.remaining(expires_at)
+        if remaining is None:
+            return timeout
+        remaining = max(remaining, 0.001)
+        if isinstance(timeout, tuple):
+            return tuple(remaining if part is None else min(part, remaining) for part in timeout)
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def is_idempotent(self, method):
+        """
+        Whether a request with this method may be sent again
+
+        :param method: HTTP method
+        :rtype: bool
+        """
+        return self.retry_non_idempotent or method.upper() in IDEMPOTENT_METHODS
+
+    def backoff(self, attempt, retry_after=None):
+        """
+        Sleep before the attempt following the given one
+
+        :param attempt: number of the attempt that just failed, starting at 1
+        :param retry_after: server supplied Retry-After in seconds
+        :return: seconds
+        :rtype: float
+        """
+        if retry_after is not None and 0 <= retry_after <= self.max_backoff:
+            return retry_after
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def _can_wait(self, delay, expires_at):
+        """Whether sleeping delay seconds still leaves some budget for another attempt"""
+        remaining = self.remaining(expires_at)
+        return remaining is None or remaining > delay
+
+    def retry_exception(self, method, err, attempt, expires_at):
+        """
+        Decide whether a failed attempt should be retried
+
+        :param method: HTTP method
+        :param err: requests exception raised by the attempt
+        :param attempt: number of the attempt that just failed, starting at 1
+        :param expires_at: value returned by start()
+        :return: seconds to sleep before retrying, None to give up
+        :rtype: float
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if not isinstance(err, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return None
+        if not (_request_not_sent(err) or self.is_idempotent(method)):
+            return None
+        delay = self.backoff(attempt)
+        return delay if self._can_wait(delay, expires_at) else None
+
+    def retry_response(self, method, response, attempt, expires_at):
+        """
+        Decide whether an attempt that got a response should be retried
+
+        :param method: HTTP method
+        :param response: response of the attempt
+        :type response: requests.Response
+        :param attempt: number of the attempt that just finished, starting at 1
+        :param expires_at: value returned by start()
+        :return: seconds to sleep before retrying, None to keep the response
+        :rtype: float
+        """
+        if attempt >= self.max_attempts or response.status_code not in self.retry_on_status:
+            return None
+        if not self.is_idempotent(method):
+            return None
+        try:
+            retry_after = float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            retry_after = None
+        delay = self.backoff(attempt, retry_after)
+        return delay if self._can_wait(delay, expires_at) else None
@@ -14,13 +14,14 @@ class RestReturn(object):
 
     def __init__(self, success=False, message=None,
                  http_status=HTTPStatus.INTERNAL_SERVER_ERROR, json_body=None,
-                 response_object=None):
+                 response_object=None, elapsed=None):
         super().__init__()
         self.__success = success
         self.__message = message
         self.__http_status = http_status
         self.__json_body = json_body
         self.__response_object = response_object
+        self.__elapsed = elapsed
 
     @property
     def success(self):
@@ -87,7 +88,21 @@ class RestReturn(object):
     def response_object(self, value):
         self.__response_object = value
 
+    @property
+    def elapsed(self):
+        """
+        Returns the wall clock time spent on the request, when it was measured
+
+        :return: seconds
+        :rtype: float
+        """
+        return self.__elapsed
+
+    @elapsed.setter
+    def elapsed(self, value):
+        self.__elapsed = value
+
     def to_dict(self):
         """Cast Object to Dictionary"""
         return {"success": self.success, "message": self.message, "http_status": self.http_status,
-                "json": self.json_body, "response": self.response_object}
+                "json": self.json_body, "response": self.response_object, "elapsed": self.elapsed}
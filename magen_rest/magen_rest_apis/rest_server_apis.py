@@ -4,10 +4,13 @@ import sys
 import logging
 from http import HTTPStatus
 
+from flask import current_app
 from flask.json import jsonify
 
 from magen_logger.logger_config import LogDefaults
 
+from .rest_json_codec import app_json_codec
+
 __author__ = "Reinaldo Penno"
 __copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
 __version__ = "0.2"
@@ -20,6 +23,7 @@ class RestServerApis(object):
     def respond(http_status=HTTPStatus.OK, title="Title", response=None):
         """
         This function prepares a HTTP Response object to be sent back to the client.
+        The body is serialized with the JSON codec installed on the app, if any, and with jsonify otherwise.
 
         :param http_status: standard http status code (int, phrase)
         :param title: app-level title of response
@@ -30,7 +34,12 @@ class RestServerApis(object):
         """
         try:
             assert isinstance(http_status, HTTPStatus)  # pass HTTPStatus, not int
-            resp = jsonify({'status': http_status, "title": title, "response": response})
+            body = {'status': http_status, "title": title, "response": response}
+            codec = app_json_codec(current_app)
+            if codec is None:
+                resp = jsonify(body)
+            else:
+                resp = current_app.response_class(codec.dumpb(body), mimetype="application/json")
             resp.status_code = int(http_status)
             return resp
         except Exception as err:
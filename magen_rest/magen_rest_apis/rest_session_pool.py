@@ -0,0 +1,226 @@
+"""Pooled HTTP Sessions shared by the Rest Client APIs"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlsplit
+
+import requests
+
+from magen_logger.logger_config import LogDefaults
+
+from .rest_instrumentation import InstrumentedHTTPAdapter
+
+__author__ = "repenno@cisco.com"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__version__ = "0.1"
+__status__ = "alpha"
+
+LOGGER = logging.getLogger(LogDefaults.default_log_name)
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_IDLE_TIMEOUT = 60.0
+
+
+class _PooledSession(object):
+    """Book keeping for a single per-host session"""
+
+    def __init__(self, session):
+        self.session = session
+        self.in_use = 0
+        self.last_used = time.monotonic()
+
+
+class RestSessionPool(object):
+    """
+    Per-host pool of reusable requests.Session objects.
+
+    Every (scheme, host, port) gets its own Session with a mounted HTTPAdapter, so TCP and TLS
+    connections are kept alive and reused between calls instead of being set up for every request.
+    Sessions that have not been used for idle_timeout seconds are closed and evicted.
+
+    Cookies are never persisted on pooled sessions: the pool is shared by unrelated callers and the
+    previous session-per-request behaviour did not carry cookies from one call to the next either.
+    """
+    __instance = None
+    __instance_lock = threading.Lock()
+
+    def __init__(self, pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 keep_alive=True, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        """
+        :param pool_connections: number of urllib3 connection pools cached per session
+        :type pool_connections: int
+        :param pool_maxsize: maximum number of connections kept alive per host
+        :type pool_maxsize: int
+        :param keep_alive: when False every request asks the server to close the connection
+        :type keep_alive: bool
+        :param idle_timeout: seconds after which an unused host session is closed, None disables eviction
+        :type idle_timeout: float
+        """
+        self.__pool_connections = pool_connections
+        self.__pool_maxsize = pool_maxsize
+        self.__keep_alive = keep_alive
+        self.__idle_timeout = idle_timeout
+        self.__sessions = dict()
+        self.__lock = threading.Lock()
+
+    @property
+    def pool_connections(self):
+        """Number of connection pools cached per session"""
+        return self.__pool_connections
+
+    @property
+    def pool_maxsize(self):
+        """Maximum number of connections kept alive per host"""
+        return self.__pool_maxsize
+
+    @property
+    def keep_alive(self):
+        """Whether connections are kept alive between requests"""
+        return self.__keep_alive
+
+    @property
+    def idle_timeout(self):
+        """Seconds after which an idle host session is evicted"""
+        return self.__idle_timeout
+
+    @staticmethod
+    def host_key(url):
+        """
+        Key used to pool sessions: scheme and network location of the url
+
+        :param url: HTTP URL
+        :type url: str
+        :return: pool key, e.g. http://localhost:5000
+        :rtype: str
+        """
+        parts = urlsplit(url)
+        return "{}://{}".format(parts.scheme.lower(), parts.netloc.lower())
+
+    def _new_session(self):
+        """
+        Create a Session with a dedicated connection pool
+
+        :rtype: requests.Session
+        """
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = InstrumentedHTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def _evict_idle(self, now):
+        """
+        Close sessions that are not in use and were idle longer than idle_timeout.
+        Must be called with the pool lock held.
+
+        :param now: current monotonic time
+        :rtype: void
+        """
+        if self.idle_timeout is None:
+            return
+        for key in [key for key, entry in self.__sessions.items()
+                    if not entry.in_use and now - entry.last_used > self.idle_timeout]:
+            LOGGER.debug("Evicting idle session for %s", key)
+            self.__sessions.pop(key).session.close()
+
+    @contextmanager
+    def session(self, url):
+        """
+        Borrow the pooled session for the host of the given url.
+        The session stays open when the block exits so its connections can be reused.
+
+        :param url: HTTP URL
+        :type url: str
+        :rtype: requests.Session
+        """
+        key = self.host_key(url)
+        with self.__lock:
+            now = time.monotonic()
+            self._evict_idle(now)
+            entry = self.__sessions.get(key)
+            if entry is None:
+                entry = _PooledSession(self._new_session())
+                self.__sessions[key] = entry
+            entry.in_use += 1
+        try:
+            yield entry.session
+        finally:
+            with self.__lock:
+                entry.in_use -= 1
+                entry.last_used = time.monotonic()
+
+    def evict_idle(self):
+        """
+        Close all sessions that exceeded the idle timeout
+
+        :rtype: void
+        """
+        with self.__lock:
+            self._evict_idle(time.monotonic())
+
+    def hosts(self):
+        """
+        Hosts that currently have a pooled session
+
+        :rtype: list
+        """
+        with self.__lock:
+            return list(self.__sessions.keys())
+
+    def close(self):
+        """
+        Close every pooled session and its connections
+
+        :rtype: void
+        """
+        with self.__lock:
+            sessions = list(self.__sessions.values())
+            self.__sessions.clear()
+        for entry in sessions:
+            entry.session.close()
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton get instance"""
+        if cls.__instance is None:
+            with cls.__instance_lock:
+                if cls.__instance is None:
+                    cls.__instance = cls()
+        return cls.__instance
+
+    @classmethod
+    def configure(cls, **kwargs):
+        """
+        Replace the shared pool by one built with the given settings.
+        Sessions of the previous pool are closed.
+
+        :param kwargs: see RestSessionPool.__init__
+        :return: the new shared pool
+        :rtype: RestSessionPool
+        """
+        with cls.__instance_lock:
+            previous = cls.__instance
+            cls.__instance = cls(**kwargs)
+        if previous is not None:
+            previous.close()
+        return cls.__instance
+
+    @classmethod
+    def reset(cls):
+        """
+        Close the shared pool and drop it, next get_instance() creates a fresh one with default settings.
+        Mostly useful for tests.
+
+        :rtype: void
+        """
+        with cls.__instance_lock:
+            previous = cls.__instance
+            cls.__instance = None
+        if previous is not None:
+            previous.close()
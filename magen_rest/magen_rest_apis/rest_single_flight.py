@@ -0,0 +1,139 @@
+"""Request Coalescing (single-flight) for Rest Client APIs"""
+import asyncio
+import threading
+
+__author__ = "repenno@cisco.com"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__version__ = "0.1"
+__status__ = "alpha"
+
+
+def flight_key(*parts):
+    """
+    Hashable key identifying identical requests
+
+    :param parts: request attributes, dicts are compared by content
+    :return: key, None when an attribute cannot be hashed and the request must not be coalesced
+    :rtype: tuple
+    """
+    key = tuple(tuple(sorted(part.items())) if isinstance(part, dict) else part for part in parts)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class _Flight(object):
+    """Call in progress shared by every caller with the same key"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Coalesces identical concurrent calls made from threads.
+
+    The first caller of a key runs the function; callers arriving with the same key while it runs
+    wait for it and get the same result, or the same exception. The key is forgotten as soon as the
+    call finishes, so nothing is cached beyond the calls that overlapped.
+    """
+
+    def __init__(self):
+        self.__flights = dict()
+        self.__lock = threading.Lock()
+        self.__coalesced = 0
+
+    @property
+    def coalesced(self):
+        """Number of calls answered by another caller's request"""
+        return self.__coalesced
+
+    def do(self, key, func):
+        """
+        Run func, or wait for the identical call already running
+
+        :param key: hashable key of the call, None to always run func
+        :param func: function without arguments
+        :type func: Callable
+        :return: result of func
+        """
+        if key is None:
+            return func()
+        with self.__lock:
+            flight = self.__flights.get(key)
+            if flight is None:
+                flight = _Flight()
+                self.__flights[key] = flight
+                leader = True
+            else:
+                self.__coalesced += 1
+                leader = False
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = func()
+        except BaseException as err:
+            flight.error = err
+            raise
+        finally:
+            with self.__lock:
+                del self.__flights[key]
+            flight.done.set()
+        return flight.result
+
+
+class AsyncSingleFlight(object):
+    """
+    Coalesces identical concurrent coroutine calls made from tasks of the same event loop.
+    Same semantics as SingleFlight.
+    """
+
+    def __init__(self):
+        self.__flights = dict()
+        self.__coalesced = 0
+
+    @property
+    def coalesced(self):
+        """Number of calls answered by another caller's request"""
+        return self.__coalesced
+
+    async def do(self, key, coro_func):
+        """
+        Await coro_func(), or the identical call already running
+
+        :param key: hashable key of the call, None to always run coro_func
+        :param coro_func: coroutine function without arguments
+        :type coro_func: Callable
+        :return: result of the coroutine
+        """
+        if key is None:
+            return await coro_func()
+        key = (asyncio.get_event_loop(), key)
+        future = self.__flights.get(key)
+        if future is not None:
+            self.__coalesced += 1
+            return await asyncio.shield(future)
+        future = asyncio.get_event_loop().create_future()
+        self.__flights[key] = future
+        try:
+            result = await coro_func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            # the exception is re-raised here, followers retrieve it from the future
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self.__flights[key]
@@ -31,6 +31,10 @@ setup(
         'magen_logger>=1.0a',
         'magen_utils>=1.2a',
       ],
+    extras_require={
+        'async': ['aiohttp>=3.3.0'],
+        'fast_json': ['orjson>=3.0.0'],
+    },
     include_package_data=True,
     package_data={
         # If any package contains *.txt or *.rst files, include them:
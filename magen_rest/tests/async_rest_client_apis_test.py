@@ -0,0 +1,176 @@
+"""Asyncio Rest Client API Test Suite"""
+import asyncio
+import json
+import time
+import unittest
+from http import HTTPStatus
+from unittest.mock import patch
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+except ImportError:  # pragma: no cover
+    web = None
+
+from magen_rest_apis.async_rest_client_apis import AsyncRestClientApis
+from magen_rest_apis.rest_client_apis import RestRequestSpec
+from magen_rest_apis.rest_single_flight import AsyncSingleFlight
+from .rest_client_apis_test_messages import MAGEN_SINGLE_ASSET_FINANCE_GET_RESP
+
+__author__ = "Reinaldo Penno"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__license__ = "New-style BSD"
+__version__ = "0.1"
+__email__ = "rapenno@gmail.com"
+
+RESOURCE_PATH = "/service/v2/resources/magen_resource/74c1c6ff-c266-43a6-9d14-82dca05cb6df/"
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class AsyncRestClientApisTest(unittest.TestCase):
+    """Asyncio Rest Client API Test"""
+    UNREACHABLE_HOST = "http://127.0.0.2"
+    NO_WEB_SERVER_RUNNING_HOST = "http://127.0.0.1"
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        app = web.Application()
+        app.router.add_get(RESOURCE_PATH, self.get_handler)
+        app.router.add_get("/slow/", self.slow_handler)
+        app.router.add_get("/error/", self.error_handler)
+        app.router.add_post("/created/", self.post_handler)
+        app.router.add_put(RESOURCE_PATH, self.put_handler)
+        app.router.add_delete(RESOURCE_PATH, self.delete_handler)
+        self.server = TestServer(app)
+        self.loop.run_until_complete(self.server.start_server())
+
+    def tearDown(self):
+        self.loop.run_until_complete(AsyncRestClientApis.close())
+        self.loop.run_until_complete(self.server.close())
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def url(self, path):
+        return str(self.server.make_url(path))
+
+    def run_coroutine(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    @staticmethod
+    async def get_handler(request):
+        return web.json_response(json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP))
+
+    async def slow_handler(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.2)
+        self.in_flight -= 1
+        return web.json_response({"slow": True})
+
+    @staticmethod
+    async def error_handler(request):
+        return web.json_response({"error": "test"}, status=HTTPStatus.INTERNAL_SERVER_ERROR)
+
+    @staticmethod
+    async def post_handler(request):
+        body = await request.json()
+        return web.json_response(body, status=HTTPStatus.CREATED, headers={"Location": str(request.url)})
+
+    @staticmethod
+    async def put_handler(request):
+        return web.json_response(await request.json())
+
+    @staticmethod
+    async def delete_handler(request):
+        return web.Response(status=HTTPStatus.NO_CONTENT)
+
+    def test_get_ok(self):
+        resp_obj = self.run_coroutine(AsyncRestClientApis.http_get_and_check_success(self.url(RESOURCE_PATH)))
+        self.assertTrue(resp_obj.success)
+        self.assertEqual(resp_obj.http_status, HTTPStatus.OK)
+        self.assertEqual(resp_obj.json_body, json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP))
+
+    def test_get_check_util(self):
+        resp_obj = self.run_coroutine(AsyncRestClientApis.http_get_and_check_success(
+            self.url(RESOURCE_PATH), lambda response: response.status_code == HTTPStatus.ACCEPTED))
+        self.assertFalse(resp_obj.success)
+        self.assertEqual(resp_obj.http_status, HTTPStatus.INTERNAL_SERVER_ERROR)
+
+    def test_get_500(self):
+        resp_obj = self.run_coroutine(AsyncRestClientApis.http_get_and_check_success(self.url("/error/")))
+        self.assertFalse(resp_obj.success)
+        self.assertEqual(resp_obj.http_status, HTTPStatus.INTERNAL_SERVER_ERROR)
+        self.assertEqual(resp_obj.json_body, {"error": "test"})
+
+    def test_get_invalid_schema(self):
+        resp_obj = self.run_coroutine(AsyncRestClientApis.http_get_and_check_success(
+            "invalid://httpbin.org/status/200"))
+        self.assertFalse(resp_obj.success)
+        self.assertEqual(resp_obj.http_status, HTTPStatus.BAD_REQUEST)
+
+    def test_get_connection_error(self):
+        resp_obj = self.run_coroutine(AsyncRestClientApis.http_get_and_check_success(
+            AsyncRestClientApisTest.NO_WEB_SERVER_RUNNING_HOST))
+        self.assertFalse(resp_obj.success)
+        self.assertEqual(resp_obj.http_status, HTTPStatus.SERVICE_UNAVAILABLE)
+
+    def test_get_read_timeout(self):
+        resp_obj = self.run_coroutine(AsyncRestClientApis.http_get_and_check_success(self.url("/slow/"),
+                                                                                     timeout=0.05))
+        self.assertFalse(resp_obj.success)
+        self.assertEqual(resp_obj.http_status, HTTPStatus.SERVICE_UNAVAILABLE)
+
+    def test_post_put_delete(self):
+        post_obj = self.run_coroutine(AsyncRestClientApis.http_post_and_check_success(
+            self.url("/created/"), json.dumps({"name": "finance"})))
+        self.assertTrue(post_obj.success)
+        self.assertEqual(post_obj.http_status, HTTPStatus.CREATED)
+        self.assertEqual(post_obj.json_body, {"name": "finance"})
+
+        put_obj = self.run_coroutine(AsyncRestClientApis.http_put_and_check_success(
+            self.url(RESOURCE_PATH), json.dumps({"name": "legal"})))
+        self.assertTrue(put_obj.success)
+        self.assertEqual(put_obj.json_body, {"name": "legal"})
+
+        delete_obj = self.run_coroutine(AsyncRestClientApis.http_delete_and_check_success(self.url(RESOURCE_PATH)))
+        self.assertTrue(delete_obj.success)
+        self.assertEqual(delete_obj.http_status, HTTPStatus.NO_CONTENT)
+        self.assertIsNone(delete_obj.json_body)
+
+    def test_gather_keeps_order(self):
+        specs = [
+            RestRequestSpec("GET", self.url(RESOURCE_PATH)),
+            RestRequestSpec("GET", self.url("/error/")),
+            RestRequestSpec("POST", self.url("/created/"), json.dumps({"name": "finance"})),
+            ("DELETE", self.url(RESOURCE_PATH)),
+        ]
+        results = self.run_coroutine(AsyncRestClientApis.http_gather(specs))
+        self.assertEqual([result.http_status for result in results],
+                         [HTTPStatus.OK, HTTPStatus.INTERNAL_SERVER_ERROR, HTTPStatus.CREATED, HTTPStatus.NO_CONTENT])
+
+    def test_gather_concurrency_cap(self):
+        specs = [RestRequestSpec("GET", self.url("/slow/"), kwargs={"timeout": 5}) for _ in range(6)]
+        start = time.monotonic()
+        results = self.run_coroutine(AsyncRestClientApis.http_gather(specs, max_concurrency=3))
+        elapsed = time.monotonic() - start
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(self.max_in_flight, 3)
+        # two waves of 0.2s, far less than six sequential calls
+        self.assertLess(elapsed, 1.0)
+
+    def test_gather_unsupported_method(self):
+        results = self.run_coroutine(AsyncRestClientApis.http_gather([RestRequestSpec("TRACE", self.url("/"))]))
+        self.assertFalse(results[0].success)
+        self.assertEqual(results[0].http_status, HTTPStatus.BAD_REQUEST)
+
+    def test_single_flight(self):
+        flight = AsyncSingleFlight()
+        specs = [RestRequestSpec("GET", self.url("/slow/"), kwargs={"timeout": 5}) for _ in range(5)]
+        with patch.object(AsyncRestClientApis, 'single_flight', flight):
+            results = self.run_coroutine(AsyncRestClientApis.http_gather(specs))
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(self.max_in_flight, 1)
+        self.assertEqual(flight.coalesced, 4)
@@ -0,0 +1,138 @@
+"""Rest Client Circuit Breaker Test Suite"""
+import json
+import unittest
+from http import HTTPStatus
+from unittest.mock import patch, MagicMock
+
+import requests
+import responses
+
+from magen_rest_apis.rest_circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitState, \
+    CircuitOpenError
+from magen_rest_apis.rest_client_apis import RestClientApis
+from magen_rest_apis.rest_exception_apis import handle_specific_exception
+from magen_rest_apis.rest_session_pool import RestSessionPool
+from .rest_client_apis_test_messages import MAGEN_SINGLE_ASSET_FINANCE_GET_RESP
+
+__author__ = "Reinaldo Penno"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__license__ = "New-style BSD"
+__version__ = "0.1"
+__email__ = "rapenno@gmail.com"
+
+MONOTONIC = 'magen_rest_apis.rest_circuit_breaker.time.monotonic'
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    """Circuit Breaker Test"""
+    KEY_SERVER_URL = 'http://localhost:5010/magen/ks/v3/asset_keys/assets/asset/'
+    OTHER_SERVER_URL = 'http://localhost:5020/magen/policy/v2/'
+
+    def setUp(self):
+        RestSessionPool.reset()
+        self.registry = CircuitBreakerRegistry(window_size=4, min_requests=4, error_threshold=0.5, cool_down=10.0)
+
+    def tearDown(self):
+        RestSessionPool.reset()
+
+    def test_OpensAtErrorRate(self):
+        breaker = CircuitBreaker("localhost:5010", window_size=4, min_requests=4, error_threshold=0.5)
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_success()
+        # not enough requests yet
+        self.assertIs(breaker.state, CircuitState.CLOSED)
+        breaker.record_failure()
+        self.assertIs(breaker.state, CircuitState.OPEN)
+        self.assertFalse(breaker.allow_request())
+        self.assertEqual(breaker.to_dict()["rejected"], 1)
+
+    def test_StaysClosedBelowErrorRate(self):
+        breaker = CircuitBreaker("localhost:5010", window_size=4, min_requests=4, error_threshold=0.5)
+        for _ in range(10):
+            breaker.record_success()
+            breaker.record_success()
+            breaker.record_success()
+            breaker.record_failure()
+        self.assertIs(breaker.state, CircuitState.CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+    def test_HalfOpenProbe(self):
+        breaker = CircuitBreaker("localhost:5010", window_size=2, min_requests=2, cool_down=10.0)
+        with patch(MONOTONIC, return_value=100.0):
+            breaker.record_failure()
+            breaker.record_failure()
+            self.assertIs(breaker.state, CircuitState.OPEN)
+        with patch(MONOTONIC, return_value=111.0):
+            self.assertIs(breaker.state, CircuitState.HALF_OPEN)
+            self.assertTrue(breaker.allow_request())
+            # a single probe at a time
+            self.assertFalse(breaker.allow_request())
+            breaker.record_failure()
+            self.assertIs(breaker.state, CircuitState.OPEN)
+        with patch(MONOTONIC, return_value=122.0):
+            self.assertTrue(breaker.allow_request())
+            breaker.record_success()
+            self.assertIs(breaker.state, CircuitState.CLOSED)
+            self.assertEqual(breaker.to_dict()["failure_rate"], 0.0)
+
+    def test_CancelGivesBackProbe(self):
+        breaker = CircuitBreaker("localhost:5010", window_size=1, min_requests=1, cool_down=0)
+        breaker.record_failure()
+        self.assertTrue(breaker.allow_request())
+        breaker.record_exception(requests.exceptions.InvalidURL())
+        self.assertTrue(breaker.allow_request())
+
+    def test_RegistryServerUrls(self):
+        server_urls = MagicMock()
+        server_urls.ingestion_server_url_host_port = "localhost:5020"
+        server_urls.identity_server_url_host_port = "localhost:5030"
+        server_urls.key_server_url_host_port = "localhost:5010"
+        server_urls.policy_server_url_host_port = "localhost:5000"
+        server_urls.location_server_url_host_port = "localhost:5000"
+        self.registry.register_server_urls(server_urls)
+        states = self.registry.states()
+        self.assertEqual(states["localhost:5010"]["services"], ["key_server"])
+        self.assertEqual(states["localhost:5000"]["services"], ["location_server", "policy_server"])
+        self.assertIs(self.registry.service_state("key_server"), CircuitState.CLOSED)
+        self.assertIs(self.registry.breaker_for_url(CircuitBreakerTest.KEY_SERVER_URL),
+                      self.registry.breaker("localhost:5010"))
+
+    def test_CircuitOpenErrorHandler(self):
+        rest_return = handle_specific_exception(CircuitOpenError("localhost:5010"))
+        self.assertFalse(rest_return.success)
+        self.assertEqual(rest_return.http_status, HTTPStatus.SERVICE_UNAVAILABLE)
+
+    @responses.activate
+    def test_ClientFailsFast(self):
+        responses.add(responses.GET, CircuitBreakerTest.KEY_SERVER_URL, body=requests.exceptions.ReadTimeout())
+        responses.add(responses.GET, CircuitBreakerTest.OTHER_SERVER_URL,
+                      json=json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP), status=200)
+        with patch.object(RestClientApis, 'circuit_breakers', self.registry):
+            for _ in range(4):
+                resp_obj = RestClientApis.http_get_and_check_success(CircuitBreakerTest.KEY_SERVER_URL)
+                self.assertEqual(resp_obj.http_status, HTTPStatus.SERVICE_UNAVAILABLE)
+            self.assertIs(self.registry.state("localhost:5010"), CircuitState.OPEN)
+            resp_obj = RestClientApis.http_get_and_check_success(CircuitBreakerTest.KEY_SERVER_URL)
+            self.assertEqual(resp_obj.http_status, HTTPStatus.SERVICE_UNAVAILABLE)
+            # other hosts are not affected
+            resp_obj = RestClientApis.http_get_and_check_success(CircuitBreakerTest.OTHER_SERVER_URL)
+            self.assertTrue(resp_obj.success)
+        # the fifth key server call never reached the network
+        self.assertEqual(len(responses.calls), 5)
+
+    @responses.activate
+    def test_ServerErrorsCountAsFailures(self):
+        responses.add(responses.GET, CircuitBreakerTest.KEY_SERVER_URL, status=503, json={})
+        with patch.object(RestClientApis, 'circuit_breakers', self.registry):
+            for _ in range(4):
+                RestClientApis.http_get_and_check_success(CircuitBreakerTest.KEY_SERVER_URL)
+        self.assertIs(self.registry.state("localhost:5010"), CircuitState.OPEN)
+
+    @responses.activate
+    def test_DisabledByDefault(self):
+        self.assertIsNone(RestClientApis.circuit_breakers)
+        responses.add(responses.GET, CircuitBreakerTest.KEY_SERVER_URL, status=503, json={})
+        for _ in range(6):
+            RestClientApis.http_get_and_check_success(CircuitBreakerTest.KEY_SERVER_URL)
+        self.assertEqual(len(responses.calls), 6)
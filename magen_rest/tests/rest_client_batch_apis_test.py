@@ -0,0 +1,108 @@
+"""Rest Client Batch API Test Suite"""
+import json
+import threading
+import time
+import unittest
+from http import HTTPStatus
+
+import responses
+
+from magen_rest_apis.rest_client_apis import RestClientApis, RestRequestSpec
+from magen_rest_apis.rest_session_pool import RestSessionPool
+from .rest_client_apis_test_messages import MAGEN_SINGLE_ASSET_FINANCE_GET_RESP, \
+    MAGEN_SINGLE_ASSET_FINANCE_POST
+
+__author__ = "Reinaldo Penno"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__license__ = "New-style BSD"
+__version__ = "0.1"
+__email__ = "rapenno@gmail.com"
+
+
+class RestClientBatchApisTest(unittest.TestCase):
+    """Rest Client Batch API Test"""
+    MAGEN_BASE_URL = 'http://magen.cisco.com/service/v2/resources/magen_resource/'
+    LOCATION_URL = MAGEN_BASE_URL + "74c1c6ff-c266-43a6-9d14-82dca05cb6df/"
+
+    def setUp(self):
+        RestSessionPool.reset()
+
+    def tearDown(self):
+        RestSessionPool.reset()
+
+    @responses.activate
+    def test_batch_results_in_input_order(self):
+        responses.add(responses.GET, RestClientBatchApisTest.LOCATION_URL,
+                      json=json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP), status=200)
+        responses.add(responses.POST, RestClientBatchApisTest.MAGEN_BASE_URL,
+                      json=json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP), status=201,
+                      headers={"Location": RestClientBatchApisTest.LOCATION_URL})
+        responses.add(responses.PUT, RestClientBatchApisTest.LOCATION_URL,
+                      json=json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP), status=200)
+        responses.add(responses.DELETE, RestClientBatchApisTest.LOCATION_URL, status=404,
+                      json={"response": "not found"})
+        specs = [
+            RestRequestSpec("GET", RestClientBatchApisTest.LOCATION_URL),
+            RestRequestSpec("POST", RestClientBatchApisTest.MAGEN_BASE_URL, MAGEN_SINGLE_ASSET_FINANCE_POST),
+            ("PUT", RestClientBatchApisTest.LOCATION_URL, MAGEN_SINGLE_ASSET_FINANCE_POST),
+            RestRequestSpec("DELETE", RestClientBatchApisTest.LOCATION_URL),
+        ]
+        results = RestClientApis.http_batch(specs, max_workers=4)
+        self.assertEqual([result.http_status for result in results],
+                         [HTTPStatus.OK, HTTPStatus.CREATED, HTTPStatus.OK, HTTPStatus.NOT_FOUND])
+        self.assertEqual([result.success for result in results], [True, True, True, False])
+        for result in results:
+            self.assertIsNotNone(result.elapsed)
+            self.assertGreaterEqual(result.elapsed, 0)
+
+    @responses.activate
+    def test_batch_check_util(self):
+        responses.add(responses.GET, RestClientBatchApisTest.LOCATION_URL,
+                      json=json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP), status=200)
+        responses.add(responses.PUT, RestClientBatchApisTest.LOCATION_URL,
+                      json=json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP), status=200)
+        specs = [
+            RestRequestSpec("GET", RestClientBatchApisTest.LOCATION_URL, check_util=lambda resp: False),
+            RestRequestSpec("PUT", RestClientBatchApisTest.LOCATION_URL, MAGEN_SINGLE_ASSET_FINANCE_POST,
+                            check_util=lambda resp: False),
+        ]
+        results = RestClientApis.http_batch(specs)
+        self.assertFalse(results[0].success)
+        self.assertFalse(results[1].success)
+        self.assertEqual(results[1].http_status, HTTPStatus.INTERNAL_SERVER_ERROR)
+
+    def test_batch_bad_items_do_not_abort(self):
+        specs = [
+            RestRequestSpec("GET", "invalid://httpbin.org/status/200"),
+            RestRequestSpec("TRACE", RestClientBatchApisTest.LOCATION_URL),
+            RestRequestSpec("GET", RestClientBatchApisTest.LOCATION_URL, kwargs={"unknown_argument": 1}),
+        ]
+        results = RestClientApis.http_batch(specs)
+        self.assertEqual([result.http_status for result in results],
+                         [HTTPStatus.BAD_REQUEST, HTTPStatus.BAD_REQUEST, HTTPStatus.INTERNAL_SERVER_ERROR])
+        self.assertFalse(any(result.success for result in results))
+
+    def test_batch_empty(self):
+        self.assertEqual(RestClientApis.http_batch([]), [])
+
+    @responses.activate
+    def test_batch_bounded_workers(self):
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def callback(request):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[0], in_flight[1])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            return 200, {}, MAGEN_SINGLE_ASSET_FINANCE_GET_RESP
+
+        responses.add_callback(responses.GET, RestClientBatchApisTest.LOCATION_URL, callback=callback,
+                               content_type="application/json")
+        specs = [RestRequestSpec("GET", RestClientBatchApisTest.LOCATION_URL) for _ in range(12)]
+        results = RestClientApis.http_batch(specs, max_workers=3)
+        self.assertTrue(all(result.success for result in results))
+        self.assertLessEqual(in_flight[1], 3)
+        self.assertGreater(in_flight[1], 1)
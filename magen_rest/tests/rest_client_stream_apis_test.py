@@ -0,0 +1,88 @@
+"""Rest Client Streaming GET Test Suite"""
+import json
+import types
+import unittest
+from http import HTTPStatus
+
+import responses
+
+from magen_rest_apis.rest_client_apis import RestClientApis
+from magen_rest_apis.rest_json_stream import JsonRecordParser, iter_json_records
+from magen_rest_apis.rest_session_pool import RestSessionPool
+from .rest_client_apis_test_messages import MAGEN_SINGLE_ASSET_FINANCE_GET_RESP
+
+__author__ = "Reinaldo Penno"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__license__ = "New-style BSD"
+__version__ = "0.1"
+__email__ = "rapenno@gmail.com"
+
+
+class RestClientStreamApisTest(unittest.TestCase):
+    """Streaming GET Test"""
+    MAGEN_BASE_URL = 'http://magen.cisco.com/service/v2/resources/magen_resource/'
+    RECORDS = [json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP), {"uuid": "aé"}, 12345, [1, 2], None]
+
+    def setUp(self):
+        RestSessionPool.reset()
+
+    def tearDown(self):
+        RestSessionPool.reset()
+
+    @staticmethod
+    def split(body, size):
+        return [body[i:i + size] for i in range(0, len(body), size)]
+
+    def test_ArrayAnyChunking(self):
+        body = json.dumps(RestClientStreamApisTest.RECORDS, ensure_ascii=False).encode("utf-8")
+        for size in (1, 3, 7, len(body)):
+            self.assertEqual(list(iter_json_records(self.split(body, size))), RestClientStreamApisTest.RECORDS)
+
+    def test_NdjsonAnyChunking(self):
+        body = "\n".join(json.dumps(record) for record in RestClientStreamApisTest.RECORDS).encode("utf-8")
+        for size in (1, 5, len(body)):
+            self.assertEqual(list(iter_json_records(self.split(body, size))), RestClientStreamApisTest.RECORDS)
+
+    def test_RecordsBeforeEndOfBody(self):
+        parser = JsonRecordParser()
+        self.assertEqual(parser.feed(b'[{"uuid": 1}, {"uu'), [{"uuid": 1}])
+        self.assertEqual(parser.feed(b'id": 2}, 3'), [{"uuid": 2}])
+        self.assertEqual(parser.feed(b'4]', final=True), [34])
+
+    def test_EmptyBodies(self):
+        self.assertEqual(list(iter_json_records([b"[ ]"])), [])
+        self.assertEqual(list(iter_json_records([b""])), [])
+        self.assertEqual(list(iter_json_records([b"\xef\xbb\xbf[1]"])), [1])
+
+    def test_MalformedBodies(self):
+        for body in (b"[1,]", b"[1 2]", b"[1] 2", b"[1", b'{"a": '):
+            with self.assertRaises(json.JSONDecodeError):
+                list(iter_json_records([body]))
+
+    @responses.activate
+    def test_StreamGet(self):
+        body = "\n".join(json.dumps(record) for record in RestClientStreamApisTest.RECORDS)
+        responses.add(responses.GET, RestClientStreamApisTest.MAGEN_BASE_URL, body=body, status=200,
+                      content_type="application/x-ndjson")
+        resp_obj = RestClientApis.http_get_stream_and_check_success(RestClientStreamApisTest.MAGEN_BASE_URL,
+                                                                    chunk_size=16)
+        self.assertTrue(resp_obj.success)
+        self.assertEqual(resp_obj.http_status, HTTPStatus.OK)
+        self.assertIsInstance(resp_obj.json_body, types.GeneratorType)
+        self.assertEqual(list(resp_obj.json_body), RestClientStreamApisTest.RECORDS)
+        self.assertIn("application/x-ndjson", responses.calls[0].request.headers["Accept"])
+
+    @responses.activate
+    def test_StreamGetNoContent(self):
+        responses.add(responses.GET, RestClientStreamApisTest.MAGEN_BASE_URL, status=204)
+        resp_obj = RestClientApis.http_get_stream_and_check_success(RestClientStreamApisTest.MAGEN_BASE_URL)
+        self.assertTrue(resp_obj.success)
+        self.assertEqual(list(resp_obj.json_body), [])
+
+    @responses.activate
+    def test_StreamGetNotFound(self):
+        responses.add(responses.GET, RestClientStreamApisTest.MAGEN_BASE_URL, status=404,
+                      json={"response": "not found"})
+        resp_obj = RestClientApis.http_get_stream_and_check_success(RestClientStreamApisTest.MAGEN_BASE_URL)
+        self.assertFalse(resp_obj.success)
+        self.assertEqual(resp_obj.http_status, HTTPStatus.NOT_FOUND)
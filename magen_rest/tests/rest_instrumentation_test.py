@@ -0,0 +1,133 @@
+"""Rest Client Instrumentation Test Suite"""
+import json
+import threading
+import unittest
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import requests
+import responses
+
+from magen_rest_apis.rest_client_apis import RestClientApis
+from magen_rest_apis.rest_instrumentation import RestInstrumentation, route_template, current_metrics
+from magen_rest_apis.rest_retry_policy import RetryPolicy
+from magen_rest_apis.rest_session_pool import RestSessionPool
+from .rest_client_apis_test_messages import MAGEN_SINGLE_ASSET_FINANCE_GET_RESP, MAGEN_SINGLE_ASSET_FINANCE_POST
+
+__author__ = "Reinaldo Penno"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__license__ = "New-style BSD"
+__version__ = "0.1"
+__email__ = "rapenno@gmail.com"
+
+
+class _AssetHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive JSON server"""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = MAGEN_SINGLE_ASSET_FINANCE_GET_RESP.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class RestInstrumentationTest(unittest.TestCase):
+    """Rest Client Instrumentation Test"""
+    MAGEN_BASE_URL = 'http://magen.cisco.com/service/v2/resources/magen_resource/'
+    LOCATION_URL = MAGEN_BASE_URL + "74c1c6ff-c266-43a6-9d14-82dca05cb6df/"
+
+    def setUp(self):
+        RestSessionPool.reset()
+        self.recorded = []
+        RestInstrumentation.get_instance().add_hook(self.recorded.append)
+
+    def tearDown(self):
+        RestInstrumentation.get_instance().clear()
+        RestSessionPool.reset()
+
+    def test_RouteTemplate(self):
+        self.assertEqual(route_template(RestInstrumentationTest.LOCATION_URL),
+                         "/service/v2/resources/magen_resource/<id>/")
+        self.assertEqual(route_template("http://localhost:5010/assets/59f2a1c4e138237f4cf2e7a1/keys/3"),
+                         "/assets/<id>/keys/<id>")
+        self.assertEqual(route_template("http://localhost:5010"), "/")
+
+    @responses.activate
+    def test_MetricsRecorded(self):
+        responses.add(responses.POST, RestInstrumentationTest.MAGEN_BASE_URL,
+                      json=json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP), status=201,
+                      headers={"Location": RestInstrumentationTest.LOCATION_URL})
+        RestClientApis.http_post_and_check_success(RestInstrumentationTest.MAGEN_BASE_URL,
+                                                   MAGEN_SINGLE_ASSET_FINANCE_POST)
+        self.assertEqual(len(self.recorded), 1)
+        metrics = self.recorded[0]
+        self.assertEqual(metrics.method, "POST")
+        self.assertEqual(metrics.host, "magen.cisco.com")
+        self.assertEqual(metrics.route, "/service/v2/resources/magen_resource/")
+        self.assertEqual(metrics.status, HTTPStatus.CREATED)
+        self.assertEqual(metrics.attempts, 1)
+        self.assertEqual(metrics.bytes_out, len(MAGEN_SINGLE_ASSET_FINANCE_POST))
+        self.assertGreater(metrics.bytes_in, 0)
+        self.assertGreaterEqual(metrics.total, 0)
+        self.assertIsNone(current_metrics())
+
+    @responses.activate
+    def test_RetriesAndErrors(self):
+        responses.add(responses.GET, RestInstrumentationTest.LOCATION_URL, status=503, json={})
+        responses.add(responses.GET, RestInstrumentationTest.LOCATION_URL, body=requests.exceptions.ReadTimeout())
+        RestClientApis.http_get_and_check_success(
+            RestInstrumentationTest.LOCATION_URL,
+            retry_policy=RetryPolicy(max_attempts=2, backoff_factor=0, jitter=False))
+        metrics = self.recorded[0]
+        self.assertEqual(metrics.attempts, 2)
+        self.assertEqual(metrics.retries, 1)
+        self.assertEqual(metrics.error, "ReadTimeout")
+        self.assertIsNone(metrics.status)
+
+    @responses.activate
+    def test_CallHooksAndFailingHook(self):
+        responses.add(responses.GET, RestInstrumentationTest.LOCATION_URL,
+                      json=json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP), status=200)
+        per_call = []
+
+        def failing(metrics):
+            raise ValueError("exporter down")
+
+        RestInstrumentation.get_instance().add_hook(failing)
+        resp_obj = RestClientApis.http_get_and_check_success(RestInstrumentationTest.LOCATION_URL,
+                                                             hooks=per_call.append)
+        self.assertTrue(resp_obj.success)
+        self.assertEqual(len(per_call), 1)
+        self.assertEqual(len(self.recorded), 1)
+
+    def test_NotMeasuredWithoutHooks(self):
+        RestInstrumentation.get_instance().clear()
+        self.assertIsNone(RestInstrumentation.get_instance().start("GET", RestInstrumentationTest.LOCATION_URL))
+
+    def test_DnsAndConnectTimings(self):
+        server = HTTPServer(("127.0.0.1", 0), _AssetHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        try:
+            url = "http://localhost:{}/assets/asset/".format(server.server_port)
+            for _ in range(2):
+                resp_obj = RestClientApis.http_get_and_check_success(url)
+                self.assertTrue(resp_obj.success)
+        finally:
+            RestSessionPool.reset()
+            server.shutdown()
+            server.server_close()
+        first, second = self.recorded
+        self.assertIsNotNone(first.dns)
+        self.assertIsNotNone(first.connect)
+        self.assertGreaterEqual(first.ttfb, 0)
+        # the kept-alive connection is reused
+        self.assertIsNone(second.dns)
+        self.assertIsNone(second.connect)
@@ -0,0 +1,104 @@
+"""JSON Codec Test Suite"""
+import datetime
+import json
+import unittest
+from http import HTTPStatus
+from unittest.mock import patch
+
+import responses
+from flask import Flask, jsonify
+
+from magen_rest_apis.magen_app import CustomJSONEncoder
+from magen_rest_apis.rest_client_apis import RestClientApis
+from magen_rest_apis.rest_json_codec import JsonCodec, OrjsonCodec, get_codec, install_json_codec, \
+    app_json_codec, orjson
+from magen_rest_apis.rest_server_apis import RestServerApis
+from magen_rest_apis.rest_session_pool import RestSessionPool
+from .rest_client_apis_test_messages import MAGEN_SINGLE_ASSET_FINANCE_GET_RESP
+
+__author__ = "Reinaldo Penno"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__license__ = "New-style BSD"
+__version__ = "0.1"
+__email__ = "rapenno@gmail.com"
+
+DOCUMENT = {
+    "uuid": "74c1c6ff-c266-43a6-9d14-82dca05cb6df",
+    "creation_timestamp": datetime.datetime(2017, 3, 1, 12, 30, 15, 123456),
+    "groups": {"finance"},
+    "keys": (key for key in ["a", "b"]),
+    "status": HTTPStatus.OK,
+    "name": "fïnance",
+    "version": 1.5,
+    "deleted": None,
+}
+
+
+def codecs():
+    """Codecs available in this environment"""
+    available = [JsonCodec()]
+    if orjson is not None:
+        available.append(OrjsonCodec())
+    return available
+
+
+class JsonCodecTest(unittest.TestCase):
+    """JSON Codec Test"""
+    MAGEN_BASE_URL = 'http://magen.cisco.com/service/v2/resources/magen_resource/'
+
+    def setUp(self):
+        RestSessionPool.reset()
+
+    def tearDown(self):
+        RestSessionPool.reset()
+
+    def test_SameOutputAsCustomJSONEncoder(self):
+        expected = json.loads(json.dumps(dict(DOCUMENT, keys=["a", "b"]), cls=CustomJSONEncoder))
+        for codec in codecs():
+            document = dict(DOCUMENT, keys=(key for key in ["a", "b"]))
+            self.assertEqual(json.loads(codec.dumps(document)), expected, codec.name)
+            self.assertEqual(codec.loads(codec.dumpb(expected)), expected, codec.name)
+            self.assertEqual(codec.loads(codec.dumps(expected)), expected, codec.name)
+        self.assertEqual(expected["creation_timestamp"], "2017-03-01 12:30:15.123456")
+
+    def test_NotSerializable(self):
+        for codec in codecs():
+            with self.assertRaises(TypeError):
+                codec.dumps({"value": object()})
+            with self.assertRaises(json.JSONDecodeError):
+                codec.loads(b'{"value": ')
+
+    def test_StdlibEdgeCases(self):
+        for codec in codecs():
+            self.assertEqual(codec.loads(codec.dumps({"big": 2 ** 70})), {"big": 2 ** 70})
+            self.assertEqual(codec.dumps({1: "a"}), '{"1":"a"}')
+
+    def test_GetCodec(self):
+        self.assertEqual(get_codec("json").name, "json")
+        self.assertEqual(get_codec().name, "orjson" if orjson is not None else "json")
+        with self.assertRaises(ValueError):
+            get_codec("pickle")
+
+    def test_RespondWithAppCodec(self):
+        app = Flask(__name__)
+        codec = install_json_codec(app, "json")
+        self.assertIs(app_json_codec(app), codec)
+        with app.test_request_context():
+            http_response = RestServerApis.respond(HTTPStatus.CREATED, "test_RespondWithAppCodec", DOCUMENT)
+            self.assertEqual(http_response.status_code, HTTPStatus.CREATED)
+            self.assertEqual(http_response.mimetype, "application/json")
+            body = json.loads(http_response.get_data())
+            self.assertEqual(body["response"]["creation_timestamp"], "2017-03-01 12:30:15.123456")
+            self.assertEqual(body["status"], 201)
+            self.assertEqual(json.loads(jsonify(groups={"a"}).get_data()), {"groups": ["a"]})
+
+    @responses.activate
+    def test_ClientCodec(self):
+        responses.add(responses.GET, JsonCodecTest.MAGEN_BASE_URL,
+                      body=MAGEN_SINGLE_ASSET_FINANCE_GET_RESP, status=200, content_type="application/json")
+        for codec in codecs():
+            with patch.object(RestClientApis, 'json_codec', codec), \
+                    patch.object(codec, 'loads', wraps=codec.loads) as loads:
+                resp_obj = RestClientApis.http_get_and_check_success(JsonCodecTest.MAGEN_BASE_URL)
+            self.assertEqual(resp_obj.json_body, json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP))
+            loads.assert_called_once()
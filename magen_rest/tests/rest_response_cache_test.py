@@ -0,0 +1,129 @@
+"""Rest Client Response Cache Test Suite"""
+import json
+import unittest
+from http import HTTPStatus
+from unittest.mock import patch
+
+import responses
+
+from magen_rest_apis.rest_client_apis import RestClientApis
+from magen_rest_apis.rest_response_cache import RestResponseCache, parse_cache_control
+from magen_rest_apis.rest_session_pool import RestSessionPool
+from .rest_client_apis_test_messages import MAGEN_SINGLE_ASSET_FINANCE_GET_RESP
+
+__author__ = "Reinaldo Penno"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__license__ = "New-style BSD"
+__version__ = "0.1"
+__email__ = "rapenno@gmail.com"
+
+MONOTONIC = 'magen_rest_apis.rest_response_cache.time.monotonic'
+
+
+class RestResponseCacheTest(unittest.TestCase):
+    """Response Cache Test"""
+    MAGEN_BASE_URL = 'http://magen.cisco.com/service/v2/resources/magen_resource/'
+    LOCATION_URL = MAGEN_BASE_URL + "74c1c6ff-c266-43a6-9d14-82dca05cb6df/"
+    ETAG = '"a1b2c3"'
+
+    def setUp(self):
+        RestSessionPool.reset()
+        self.cache = RestResponseCache()
+
+    def tearDown(self):
+        RestSessionPool.reset()
+
+    def add_get(self, url=LOCATION_URL, **headers):
+        responses.add(responses.GET, url, json=json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP), status=200,
+                      headers=headers)
+
+    def test_ParseCacheControl(self):
+        self.assertEqual(parse_cache_control({"Cache-Control": "public, max-age=60"}), (False, 60))
+        self.assertEqual(parse_cache_control({"Cache-Control": "no-cache, max-age=60"}), (False, 0))
+        self.assertEqual(parse_cache_control({"Cache-Control": "no-store"}), (True, None))
+        self.assertEqual(parse_cache_control({}), (False, None))
+
+    @responses.activate
+    def test_RevalidateNotModified(self):
+        self.add_get(ETag=RestResponseCacheTest.ETAG)
+        responses.add(responses.GET, RestResponseCacheTest.LOCATION_URL, status=304,
+                      headers={"ETag": RestResponseCacheTest.ETAG})
+        first = RestClientApis.http_get_and_check_success(RestResponseCacheTest.LOCATION_URL, cache=self.cache)
+        second = RestClientApis.http_get_and_check_success(RestResponseCacheTest.LOCATION_URL, cache=self.cache)
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(responses.calls[1].request.headers["If-None-Match"], RestResponseCacheTest.ETAG)
+        self.assertTrue(second.success)
+        self.assertEqual(second.http_status, HTTPStatus.OK)
+        self.assertEqual(second.json_body, first.json_body)
+        self.assertEqual(self.cache.stats()["revalidated"], 1)
+
+    @responses.activate
+    def test_LastModifiedRevalidation(self):
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        self.add_get(**{"Last-Modified": last_modified})
+        self.add_get(**{"Last-Modified": "Thu, 22 Oct 2015 07:28:00 GMT"})
+        RestClientApis.http_get_and_check_success(RestResponseCacheTest.LOCATION_URL, cache=self.cache)
+        resp_obj = RestClientApis.http_get_and_check_success(RestResponseCacheTest.LOCATION_URL, cache=self.cache)
+        self.assertEqual(responses.calls[1].request.headers["If-Modified-Since"], last_modified)
+        self.assertTrue(resp_obj.success)
+        self.assertEqual(self.cache.get(RestResponseCacheTest.LOCATION_URL).last_modified,
+                         "Thu, 22 Oct 2015 07:28:00 GMT")
+
+    @responses.activate
+    def test_FreshServedFromMemory(self):
+        self.add_get(**{"Cache-Control": "max-age=60"})
+        with patch(MONOTONIC, return_value=1000.0):
+            RestClientApis.http_get_and_check_success(RestResponseCacheTest.LOCATION_URL, cache=self.cache)
+        with patch(MONOTONIC, return_value=1059.0):
+            resp_obj = RestClientApis.http_get_and_check_success(RestResponseCacheTest.LOCATION_URL,
+                                                                 cache=self.cache,
+                                                                 check_util=lambda resp: resp.status_code == 200)
+        self.assertTrue(resp_obj.success)
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        with patch(MONOTONIC, return_value=1061.0):
+            RestClientApis.http_get_and_check_success(RestResponseCacheTest.LOCATION_URL, cache=self.cache)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_NoStoreAndNoValidators(self):
+        self.add_get(**{"Cache-Control": "no-store", "ETag": RestResponseCacheTest.ETAG})
+        self.add_get(RestResponseCacheTest.MAGEN_BASE_URL)
+        RestClientApis.http_get_and_check_success(RestResponseCacheTest.LOCATION_URL, cache=self.cache)
+        RestClientApis.http_get_and_check_success(RestResponseCacheTest.MAGEN_BASE_URL, cache=self.cache)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_LruAndMemoryCap(self):
+        with responses.RequestsMock() as rsps:
+            for index in range(3):
+                rsps.add(responses.GET, RestResponseCacheTest.MAGEN_BASE_URL + str(index), body="x" * 100,
+                         headers={"ETag": '"{}"'.format(index)})
+            cache = RestResponseCache(max_entries=2, max_bytes=250)
+            for index in range(3):
+                cache.store(str(index), RestClientApis._send("GET", RestResponseCacheTest.MAGEN_BASE_URL + str(index)),
+                            None)
+                cache.get("0")
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get("0"))
+        self.assertIsNone(cache.get("1"))
+        self.assertEqual(cache.size, 200)
+        small = RestResponseCache(max_bytes=50)
+        self.assertIsNone(small.store("0", cache.get("0").response, None))
+
+    @responses.activate
+    def test_TtlEviction(self):
+        self.add_get(ETag=RestResponseCacheTest.ETAG)
+        cache = RestResponseCache(ttl=10)
+        with patch(MONOTONIC, return_value=1000.0):
+            RestClientApis.http_get_and_check_success(RestResponseCacheTest.LOCATION_URL, cache=cache)
+        with patch(MONOTONIC, return_value=1011.0):
+            self.assertIsNone(cache.get(RestResponseCacheTest.LOCATION_URL))
+
+    @responses.activate
+    def test_ClassLevelCacheSkipsAuth(self):
+        self.add_get(ETag=RestResponseCacheTest.ETAG)
+        with patch.object(RestClientApis, 'response_cache', self.cache):
+            RestClientApis.http_get_and_check_success(RestResponseCacheTest.LOCATION_URL, auth=("user", "pass"))
+            self.assertEqual(len(self.cache), 0)
+            RestClientApis.http_get_and_check_success(RestResponseCacheTest.LOCATION_URL)
+            self.assertEqual(len(self.cache), 1)
@@ -0,0 +1,155 @@
+"""Rest Client Retry Policy Test Suite"""
+import json
+import unittest
+from http import HTTPStatus
+from unittest.mock import patch
+
+import requests
+import responses
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from magen_rest_apis.rest_client_apis import RestClientApis
+from magen_rest_apis.rest_retry_policy import RetryPolicy
+from magen_rest_apis.rest_session_pool import RestSessionPool
+from .rest_client_apis_test_messages import MAGEN_SINGLE_ASSET_FINANCE_GET_RESP, \
+    MAGEN_SINGLE_ASSET_FINANCE_POST
+
+__author__ = "Reinaldo Penno"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__license__ = "New-style BSD"
+__version__ = "0.1"
+__email__ = "rapenno@gmail.com"
+
+
+def connection_refused():
+    """ConnectionError as raised by requests when the TCP connection could not be established"""
+    reason = NewConnectionError(None, "Connection refused")
+    return requests.exceptions.ConnectionError(MaxRetryError(None, "/", reason=reason))
+
+
+class RetryPolicyTest(unittest.TestCase):
+    """Retry Policy Test"""
+    MAGEN_BASE_URL = 'http://magen.cisco.com/service/v2/resources/magen_resource/'
+    LOCATION_URL = MAGEN_BASE_URL + "74c1c6ff-c266-43a6-9d14-82dca05cb6df/"
+    FAST_RETRIES = RetryPolicy(max_attempts=3, backoff_factor=0, jitter=False)
+
+    def setUp(self):
+        RestSessionPool.reset()
+
+    def tearDown(self):
+        RestSessionPool.reset()
+
+    def test_DefaultPolicyNoRetry(self):
+        self.assertEqual(RestClientApis.retry_policy.max_attempts, 1)
+
+    def test_InvalidMaxAttempts(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    def test_Backoff(self):
+        policy = RetryPolicy(backoff_factor=0.1, max_backoff=0.3, jitter=False)
+        self.assertEqual([policy.backoff(attempt) for attempt in range(1, 5)], [0.1, 0.2, 0.3, 0.3])
+        self.assertEqual(policy.backoff(1, retry_after=0.25), 0.25)
+        self.assertEqual(policy.backoff(1, retry_after=120), 0.1)
+        jittered = RetryPolicy(backoff_factor=0.1, max_backoff=0.3)
+        for _ in range(20):
+            self.assertTrue(0 <= jittered.backoff(3) <= 0.3)
+
+    def test_AttemptTimeoutShrinksToDeadline(self):
+        policy = RetryPolicy(deadline=1.0)
+        with patch('magen_rest_apis.rest_retry_policy.time.monotonic', return_value=100.0):
+            expires_at = policy.start()
+        with patch('magen_rest_apis.rest_retry_policy.time.monotonic', return_value=100.5):
+            self.assertAlmostEqual(policy.attempt_timeout(2.0, expires_at), 0.5)
+            self.assertAlmostEqual(policy.attempt_timeout(0.2, expires_at), 0.2)
+            self.assertEqual(policy.attempt_timeout((0.1, 2.0), expires_at), (0.1, 0.5))
+        self.assertEqual(RetryPolicy().attempt_timeout(2.0, None), 2.0)
+
+    def test_NoRetryPastDeadline(self):
+        policy = RetryPolicy(max_attempts=5, backoff_factor=1, jitter=False, deadline=0.5)
+        expires_at = policy.start()
+        self.assertIsNone(policy.retry_exception("GET", requests.exceptions.ReadTimeout(), 1, expires_at))
+
+    @responses.activate
+    def test_RetryOnStatusThenSuccess(self):
+        responses.add(responses.GET, RetryPolicyTest.LOCATION_URL, status=503, json={})
+        responses.add(responses.GET, RetryPolicyTest.LOCATION_URL, status=502, json={})
+        responses.add(responses.GET, RetryPolicyTest.LOCATION_URL,
+                      json=json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP), status=200)
+        resp_obj = RestClientApis.http_get_and_check_success(RetryPolicyTest.LOCATION_URL,
+                                                             retry_policy=RetryPolicyTest.FAST_RETRIES)
+        self.assertTrue(resp_obj.success)
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_RetryExhausted(self):
+        responses.add(responses.GET, RetryPolicyTest.LOCATION_URL, status=503, json={"error": "busy"})
+        resp_obj = RestClientApis.http_get_and_check_success(RetryPolicyTest.LOCATION_URL,
+                                                             retry_policy=RetryPolicyTest.FAST_RETRIES)
+        self.assertFalse(resp_obj.success)
+        self.assertEqual(resp_obj.http_status, HTTPStatus.SERVICE_UNAVAILABLE)
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_NonRetryableStatus(self):
+        responses.add(responses.GET, RetryPolicyTest.LOCATION_URL, status=500, json={})
+        RestClientApis.http_get_and_check_success(RetryPolicyTest.LOCATION_URL,
+                                                  retry_policy=RetryPolicyTest.FAST_RETRIES)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_PostNotRetriedOnStatus(self):
+        responses.add(responses.POST, RetryPolicyTest.MAGEN_BASE_URL, status=503, json={})
+        resp_obj = RestClientApis.http_post_and_check_success(RetryPolicyTest.MAGEN_BASE_URL,
+                                                              MAGEN_SINGLE_ASSET_FINANCE_POST,
+                                                              retry_policy=RetryPolicyTest.FAST_RETRIES)
+        self.assertEqual(resp_obj.http_status, HTTPStatus.SERVICE_UNAVAILABLE)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_PostNotRetriedOnReadTimeout(self):
+        responses.add(responses.POST, RetryPolicyTest.MAGEN_BASE_URL, body=requests.exceptions.ReadTimeout())
+        resp_obj = RestClientApis.http_post_and_check_success(RetryPolicyTest.MAGEN_BASE_URL,
+                                                              MAGEN_SINGLE_ASSET_FINANCE_POST,
+                                                              retry_policy=RetryPolicyTest.FAST_RETRIES)
+        self.assertEqual(resp_obj.http_status, HTTPStatus.SERVICE_UNAVAILABLE)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_PostRetriedWhenConnectionRefused(self):
+        responses.add(responses.POST, RetryPolicyTest.MAGEN_BASE_URL, body=connection_refused())
+        responses.add(responses.POST, RetryPolicyTest.MAGEN_BASE_URL,
+                      json=json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP), status=201,
+                      headers={"Location": RetryPolicyTest.LOCATION_URL})
+        resp_obj = RestClientApis.http_post_and_check_success(RetryPolicyTest.MAGEN_BASE_URL,
+                                                              MAGEN_SINGLE_ASSET_FINANCE_POST,
+                                                              retry_policy=RetryPolicyTest.FAST_RETRIES)
+        self.assertTrue(resp_obj.success)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_DeleteRetriedOnReadTimeout(self):
+        responses.add(responses.DELETE, RetryPolicyTest.LOCATION_URL, body=requests.exceptions.ReadTimeout())
+        responses.add(responses.DELETE, RetryPolicyTest.LOCATION_URL, status=204)
+        resp_obj = RestClientApis.http_delete_and_check_success(RetryPolicyTest.LOCATION_URL,
+                                                                retry_policy=RetryPolicyTest.FAST_RETRIES)
+        self.assertTrue(resp_obj.success)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_ClassLevelPolicy(self):
+        responses.add(responses.GET, RetryPolicyTest.LOCATION_URL, body=requests.exceptions.ConnectTimeout())
+        responses.add(responses.GET, RetryPolicyTest.LOCATION_URL,
+                      json=json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP), status=200)
+        with patch.object(RestClientApis, 'retry_policy', RetryPolicyTest.FAST_RETRIES):
+            resp_obj = RestClientApis.http_get_and_check_success(RetryPolicyTest.LOCATION_URL)
+        self.assertTrue(resp_obj.success)
+        self.assertEqual(len(responses.calls), 2)
+
+    def test_DefaultTimeout(self):
+        with patch.object(RestClientApis, 'default_timeout', 7.5), \
+                patch.object(requests.Session, 'request', side_effect=requests.exceptions.ReadTimeout()) as request:
+            RestClientApis.http_delete_and_check_success(RetryPolicyTest.LOCATION_URL)
+            RestClientApis.http_put_and_check_success(RetryPolicyTest.LOCATION_URL, MAGEN_SINGLE_ASSET_FINANCE_POST,
+                                                      timeout=1.5)
+        self.assertEqual([call[1]["timeout"] for call in request.call_args_list], [7.5, 1.5])
@@ -0,0 +1,115 @@
+"""Rest Session Pool Test Suite"""
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+import responses
+
+from magen_rest_apis.rest_client_apis import RestClientApis
+from magen_rest_apis.rest_session_pool import RestSessionPool
+from .rest_client_apis_test_messages import MAGEN_SINGLE_ASSET_FINANCE_GET_RESP
+
+__author__ = "Reinaldo Penno"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__license__ = "New-style BSD"
+__version__ = "0.1"
+__email__ = "rapenno@gmail.com"
+
+
+class RestSessionPoolTest(unittest.TestCase):
+    """Rest Session Pool Test"""
+    MAGEN_BASE_URL = 'http://magen.cisco.com/service/v2/resources/magen_resource/'
+    LOCATION_URL = MAGEN_BASE_URL + "74c1c6ff-c266-43a6-9d14-82dca05cb6df/"
+    OTHER_HOST_URL = 'http://magen.cisco.com:5010/magen/ks/v3/'
+
+    def setUp(self):
+        RestSessionPool.reset()
+
+    def tearDown(self):
+        RestSessionPool.reset()
+
+    def test_SameHostSameSession(self):
+        pool = RestSessionPool.get_instance()
+        with pool.session(RestSessionPoolTest.LOCATION_URL) as first:
+            pass
+        with pool.session(RestSessionPoolTest.MAGEN_BASE_URL) as second:
+            pass
+        self.assertIs(first, second)
+        self.assertEqual(pool.hosts(), ["http://magen.cisco.com"])
+
+    def test_DifferentHostDifferentSession(self):
+        pool = RestSessionPool.get_instance()
+        with pool.session(RestSessionPoolTest.LOCATION_URL) as first:
+            pass
+        with pool.session(RestSessionPoolTest.OTHER_HOST_URL) as second:
+            pass
+        self.assertIsNot(first, second)
+        self.assertEqual(len(pool.hosts()), 2)
+
+    def test_IdleEviction(self):
+        pool = RestSessionPool.configure(idle_timeout=10)
+        with patch('magen_rest_apis.rest_session_pool.time.monotonic', return_value=100.0):
+            with pool.session(RestSessionPoolTest.LOCATION_URL):
+                pass
+        with patch('magen_rest_apis.rest_session_pool.time.monotonic', return_value=105.0):
+            pool.evict_idle()
+        self.assertEqual(len(pool.hosts()), 1)
+        with patch('magen_rest_apis.rest_session_pool.time.monotonic', return_value=111.0):
+            pool.evict_idle()
+        self.assertEqual(pool.hosts(), [])
+
+    def test_InUseSessionNotEvicted(self):
+        pool = RestSessionPool.configure(idle_timeout=0)
+        with pool.session(RestSessionPoolTest.LOCATION_URL):
+            pool.evict_idle()
+            self.assertEqual(len(pool.hosts()), 1)
+        pool.evict_idle()
+        self.assertEqual(pool.hosts(), [])
+
+    def test_KeepAliveDisabled(self):
+        pool = RestSessionPool.configure(keep_alive=False)
+        with pool.session(RestSessionPoolTest.LOCATION_URL) as session:
+            self.assertEqual(session.headers["Connection"], "close")
+
+    def test_Configure(self):
+        pool = RestSessionPool.configure(pool_maxsize=32)
+        self.assertIs(RestSessionPool.get_instance(), pool)
+        with pool.session(RestSessionPoolTest.LOCATION_URL) as session:
+            self.assertEqual(session.get_adapter(RestSessionPoolTest.LOCATION_URL)._pool_maxsize, 32)
+
+    def test_CloseAndReset(self):
+        pool = RestSessionPool.get_instance()
+        with pool.session(RestSessionPoolTest.LOCATION_URL):
+            pass
+        pool.close()
+        self.assertEqual(pool.hosts(), [])
+        RestSessionPool.reset()
+        self.assertIsNot(RestSessionPool.get_instance(), pool)
+
+    @responses.activate
+    def test_CookiesNotShared(self):
+        responses.add(responses.GET, RestSessionPoolTest.LOCATION_URL,
+                      json=json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP), status=200,
+                      headers={"Set-Cookie": "session=secret; Path=/"})
+        RestClientApis.http_get_and_check_success(RestSessionPoolTest.LOCATION_URL)
+        with RestSessionPool.get_instance().session(RestSessionPoolTest.LOCATION_URL) as session:
+            self.assertEqual(len(session.cookies), 0)
+
+    @responses.activate
+    def test_ConcurrentRequestsShareSession(self):
+        responses.add(responses.GET, RestSessionPoolTest.LOCATION_URL,
+                      json=json.loads(MAGEN_SINGLE_ASSET_FINANCE_GET_RESP), status=200)
+        results = list()
+
+        def worker():
+            results.append(RestClientApis.http_get_and_check_success(RestSessionPoolTest.LOCATION_URL))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(RestSessionPool.get_instance().hosts(), ["http://magen.cisco.com"])
@@ -0,0 +1,111 @@
+"""Rest Client Single-Flight Test Suite"""
+import threading
+import time
+import unittest
+from http import HTTPStatus
+from unittest.mock import patch
+
+import requests
+import responses
+
+from magen_rest_apis.rest_client_apis import RestClientApis, RestRequestSpec
+from magen_rest_apis.rest_session_pool import RestSessionPool
+from magen_rest_apis.rest_single_flight import SingleFlight, flight_key
+from .rest_client_apis_test_messages import MAGEN_SINGLE_ASSET_FINANCE_GET_RESP
+
+__author__ = "Reinaldo Penno"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__license__ = "New-style BSD"
+__version__ = "0.1"
+__email__ = "rapenno@gmail.com"
+
+
+class SingleFlightTest(unittest.TestCase):
+    """Single-Flight Test"""
+    MAGEN_BASE_URL = 'http://magen.cisco.com/service/v2/resources/magen_resource/'
+    LOCATION_URL = MAGEN_BASE_URL + "74c1c6ff-c266-43a6-9d14-82dca05cb6df/"
+
+    def setUp(self):
+        RestSessionPool.reset()
+
+    def tearDown(self):
+        RestSessionPool.reset()
+
+    @staticmethod
+    def run_threads(count, target):
+        results = [None] * count
+        barrier = threading.Barrier(count)
+
+        def worker(index):
+            barrier.wait()
+            results[index] = target()
+
+        threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_FlightKey(self):
+        self.assertEqual(flight_key("url", {"b": 1, "a": 2}), flight_key("url", {"a": 2, "b": 1}))
+        self.assertIsNone(flight_key("url", requests.auth.HTTPBasicAuth("user", "pass"), ["list"]))
+
+    def test_SharedResult(self):
+        flight = SingleFlight()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.2)
+            return object()
+
+        results = self.run_threads(5, lambda: flight.do("key", slow))
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(flight.coalesced, 4)
+        # nothing is remembered once the call is over
+        flight.do("key", slow)
+        self.assertEqual(len(calls), 2)
+
+    def test_SharedException(self):
+        flight = SingleFlight()
+
+        def failing():
+            time.sleep(0.2)
+            raise ValueError("failed")
+
+        def call():
+            try:
+                flight.do("key", failing)
+            except ValueError as err:
+                return err
+
+        errors = self.run_threads(3, call)
+        self.assertTrue(all(isinstance(err, ValueError) for err in errors))
+
+    @responses.activate
+    def test_ClientCoalescesGets(self):
+        def callback(request):
+            time.sleep(0.2)
+            return 200, {}, MAGEN_SINGLE_ASSET_FINANCE_GET_RESP
+
+        responses.add_callback(responses.GET, SingleFlightTest.LOCATION_URL, callback=callback,
+                               content_type="application/json")
+        with patch.object(RestClientApis, 'single_flight', SingleFlight()):
+            results = RestClientApis.http_batch([RestRequestSpec("GET", SingleFlightTest.LOCATION_URL)] * 6,
+                                                max_workers=6)
+        self.assertEqual(len(responses.calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(results[0].http_status, HTTPStatus.OK)
+
+    @responses.activate
+    def test_DifferentCheckUtilNotCoalesced(self):
+        responses.add(responses.GET, SingleFlightTest.LOCATION_URL, body=MAGEN_SINGLE_ASSET_FINANCE_GET_RESP,
+                      status=200, content_type="application/json")
+        with patch.object(RestClientApis, 'single_flight', SingleFlight()):
+            ok = RestClientApis.http_get_and_check_success(SingleFlightTest.LOCATION_URL)
+            not_ok = RestClientApis.http_get_and_check_success(SingleFlightTest.LOCATION_URL,
+                                                               check_util=lambda resp: False)
+        self.assertTrue(ok.success)
+        self.assertFalse(not_ok.success)
@@ -0,0 +1,140 @@
+#! /usr/bin/python3
+"""Histogram Metric Class"""
+import bisect
+import threading
+import uuid
+
+from magen_statistics_api.metric import Metric
+
+__author__ = "alifar@cisco.com"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__version__ = "0.1"
+__status__ = "alpha"
+__date__ = "11/02/2017"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class Histogram(Metric):
+    """
+    This class represents Histogram statistics type. A histogram samples observations (usually request
+    durations or response sizes) and counts them in configurable buckets. It also keeps the sum of all
+    observations; abs_value is the number of observations.
+    """
+
+    def __init__(self, source, name, buckets=LATENCY_BUCKETS, labels=None):
+        """
+        Init method
+
+        :param source: string; name of Service that invoked Metric creation
+        :param name: any string without spaces; name of Metric
+        :param buckets: upper bounds of the buckets, an implicit +Inf bucket is added
+        :param labels: dict of str; dimensions of the histogram, e.g. host and route
+        """
+        super().__init__(name, source)
+        class_name = __class__.__name__
+        self.namespace = class_name  # Metric.Histogram
+        self.__buckets = tuple(sorted(buckets))
+        self.__bucket_counts = [0] * (len(self.__buckets) + 1)
+        self.__sum = 0.0
+        self.__labels = dict(labels or {})
+        self.__lock = threading.Lock()
+        self.metric_uuid = str(uuid.uuid4())
+        super().metrics_collections.add_to_collection(class_name, self)
+
+    @property
+    def flavor(self):
+        """Histograms have no flavor"""
+        return None
+
+    @property
+    def buckets(self):
+        """Upper bounds of the buckets"""
+        return self.__buckets
+
+    @property
+    def labels(self):
+        """Dimensions of the histogram"""
+        return self.__labels
+
+    @property
+    def sum(self):
+        """Sum of all observations"""
+        return self.__sum
+
+    @property
+    def count(self):
+        """Number of observations"""
+        return self.abs_value
+
+    def observe(self, value):
+        """
+        Method records an observation
+
+        :param value: observed value, e.g. seconds or bytes
+        :rtype: void
+        """
+        index = bisect.bisect_left(self.__buckets, value)
+        with self.__lock:
+            self.__bucket_counts[index] += 1
+            self.__sum += value
+            self.abs_value += 1
+
+    def cumulative_counts(self):
+        """
+        Number of observations less than or equal to each bucket bound
+
+        :return: list of (upper bound, count) pairs, the last bound is float("inf")
+        :rtype: list
+        """
+        with self.__lock:
+            counts = list(self.__bucket_counts)
+        result = []
+        total = 0
+        for bound, count in zip(self.__buckets + (float("inf"),), counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, quantile):
+        """
+        Estimate a quantile as the upper bound of the bucket it falls in
+
+        :param quantile: float between 0 and 1
+        :return: bucket upper bound, None without observations
+        :rtype: float
+        """
+        cumulative = self.cumulative_counts()
+        total = cumulative[-1][1]
+        if not total:
+            return None
+        rank = quantile * total
+        for bound, count in cumulative:
+            if count >= rank:
+                return bound
+        return cumulative[-1][0]
+
+    def reset(self):
+        """
+        Method drops all observations
+
+        :rtype: void
+        """
+        with self.__lock:
+            self.__bucket_counts = [0] * (len(self.__buckets) + 1)
+            self.__sum = 0.0
+            self.abs_value = 0
+
+    def to_dict(self):
+        data_dict = super().to_dict()
+        data_dict["sum"] = self.sum
+        data_dict["labels"] = dict(self.labels)
+        data_dict["buckets"] = [{"le": "+Inf" if bound == float("inf") else bound, "count": count}
+                                for bound, count in self.cumulative_counts()]
+        if self.provide_detailed_info:
+            for key in ("metrics_collections", "provide_detailed_info"):
+                data_dict.pop(key, None)
+            for key in [key for key in data_dict if key.startswith("_" + __class__.__name__ + "__")]:
+                del data_dict[key]
+        return data_dict
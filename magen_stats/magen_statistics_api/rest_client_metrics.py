@@ -0,0 +1,114 @@
+#! /usr/bin/python3
+"""Rest Client Metrics: exports RestClientApis instrumentation to Histograms"""
+import threading
+
+from magen_rest_apis.rest_instrumentation import RestInstrumentation
+from magen_statistics_api.histogram_metric import Histogram, LATENCY_BUCKETS, SIZE_BUCKETS
+
+__author__ = "alifar@cisco.com"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__version__ = "0.1"
+__status__ = "alpha"
+__date__ = "11/02/2017"
+
+LATENCY_MEASURES = ("total", "ttfb", "dns", "connect")
+SIZE_MEASURES = ("bytes_in", "bytes_out")
+RETRY_BUCKETS = (0, 1, 2, 3, 5, 10)
+
+
+class RestClientMetrics(object):
+    """
+    Instrumentation hook feeding per host, per route histograms.
+
+    For every call made through RestClientApis the latencies (total, ttfb, dns, connect), the sizes
+    (bytes_in, bytes_out) and the number of retries are observed in a Histogram labelled with the
+    host, HTTP method and route of the call. Histograms are created on first use and registered in
+    MetricsCollections like any other Metric.
+    """
+
+    def __init__(self, source, latency_buckets=LATENCY_BUCKETS, size_buckets=SIZE_BUCKETS):
+        """
+        :param source: string; name of Service making the calls
+        :param latency_buckets: bucket bounds for latencies in seconds
+        :param size_buckets: bucket bounds for sizes in bytes
+        """
+        self.__source = source
+        self.__latency_buckets = latency_buckets
+        self.__size_buckets = size_buckets
+        self.__histograms = dict()
+        self.__lock = threading.Lock()
+
+    @property
+    def source(self):
+        """Name of Service making the calls"""
+        return self.__source
+
+    def _buckets(self, measure):
+        if measure in SIZE_MEASURES:
+            return self.__size_buckets
+        if measure == "retries":
+            return RETRY_BUCKETS
+        return self.__latency_buckets
+
+    def histogram(self, host, method, route, measure):
+        """
+        Histogram of a measure for a host and route, created if needed
+
+        :param host: host:port of the called service
+        :param method: HTTP method
+        :param route: route of the call, see rest_instrumentation.route_template
+        :param measure: total, ttfb, dns, connect, bytes_in, bytes_out or retries
+        :rtype: Histogram
+        """
+        key = (host, method, route, measure)
+        with self.__lock:
+            histogram = self.__histograms.get(key)
+            if histogram is None:
+                name = "{}.rest_client.{}.{}.{}.{}".format(self.source, host, method, route, measure)
+                labels = dict(host=host, method=method, route=route, measure=measure)
+                histogram = Histogram(self.source, name, self._buckets(measure), labels)
+                self.__histograms[key] = histogram
+            return histogram
+
+    def histograms(self, host=None):
+        """
+        Histograms created so far
+
+        :param host: only those of this host:port
+        :return: histograms keyed by (host, method, route, measure)
+        :rtype: dict
+        """
+        with self.__lock:
+            return {key: value for key, value in self.__histograms.items() if host is None or key[0] == host}
+
+    def __call__(self, metrics):
+        """
+        Instrumentation hook
+
+        :param metrics: measurements of a call
+        :type metrics: RequestMetrics
+        :rtype: void
+        """
+        for measure in LATENCY_MEASURES + SIZE_MEASURES:
+            value = getattr(metrics, measure)
+            if value is not None:
+                self.histogram(metrics.host, metrics.method, metrics.route, measure).observe(value)
+        self.histogram(metrics.host, metrics.method, metrics.route, "retries").observe(metrics.retries)
+
+    def install(self):
+        """
+        Register as a hook for every RestClientApis call
+
+        :return: self
+        :rtype: RestClientMetrics
+        """
+        RestInstrumentation.get_instance().add_hook(self)
+        return self
+
+    def uninstall(self):
+        """
+        Unregister the hook
+
+        :rtype: void
+        """
+        RestInstrumentation.get_instance().remove_hook(self)
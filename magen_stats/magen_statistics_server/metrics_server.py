@@ -3,6 +3,7 @@
 from flask import Flask
 from flask_cors import CORS
 from magen_rest_apis.magen_app import CustomJSONEncoder
+from magen_rest_apis.rest_json_codec import install_json_codec
 from magen_utils_apis.magen_flask_response import JSONifiedResponse
 from magen_utils_apis.singleton_meta import Singleton
 
@@ -21,6 +22,7 @@ class MetricsApp(metaclass=Singleton):
         _MetricsFlask = type('MetricsFlask', (Flask,), {'response_class': JSONifiedResponse})
         self.__metrics = _MetricsFlask(__name__)
         self.__metrics.json_encoder = CustomJSONEncoder
+        install_json_codec(self.__metrics)
         CORS(self.__metrics)
 
     @property
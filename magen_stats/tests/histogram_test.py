@@ -0,0 +1,81 @@
+#! /usr/bin/python3
+import json
+import unittest
+
+import magen_core_test_env
+import responses
+
+from magen_rest_apis.rest_client_apis import RestClientApis
+from magen_rest_apis.rest_instrumentation import RestInstrumentation
+from magen_statistics_api.histogram_metric import Histogram
+from magen_statistics_api.metric import MetricsCollections
+from magen_statistics_api.rest_client_metrics import RestClientMetrics
+
+__author__ = "Alena Lifar"
+__copyright__ = "Copyright(c) 2017, Cisco Systems, Inc."
+__version__ = "0.1"
+__status__ = "alpha"
+__email__ = "alifar@cisco.com"
+__date__ = "11/02/2017"
+
+ASSET_URL = "http://localhost:5020/magen/ingestion/v2/assets/asset/74c1c6ff-c266-43a6-9d14-82dca05cb6df/"
+
+
+class TestHistogram(unittest.TestCase):
+    """
+    Tests for Histogram Metric and Rest Client Metrics
+    """
+
+    def tearDown(self):
+        """
+        Method runs after each test and removes created data
+
+        :rtype: void
+        """
+        RestInstrumentation.get_instance().clear()
+        MetricsCollections().clear()
+
+    def test_Observe(self):
+        """
+        Observations land in the right buckets
+
+        :rtype: void
+        """
+        histogram = Histogram("magen_stats_test", "latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.sum, 2.65)
+        self.assertEqual(histogram.cumulative_counts(), [(0.1, 2), (1.0, 3), (float("inf"), 4)])
+        self.assertEqual(histogram.quantile(0.5), 0.1)
+        self.assertEqual(histogram.quantile(0.75), 1.0)
+        self.assertIs(MetricsCollections().get_metric_by_uuid(Histogram.__name__, histogram.metric_uuid), histogram)
+        histogram_dict = histogram.to_dict()
+        self.assertEqual(histogram_dict["buckets"][-1], {"le": "+Inf", "count": 4})
+        histogram.provide_detailed_info = True
+        self.assertEqual(json.loads(json.dumps(histogram.to_dict()))["abs_value"], 4)
+        histogram.reset()
+        self.assertEqual(histogram.count, 0)
+        self.assertIsNone(histogram.quantile(0.5))
+
+    @responses.activate
+    def test_RestClientMetrics(self):
+        """
+        RestClientApis calls feed per host and route histograms
+
+        :rtype: void
+        """
+        responses.add(responses.GET, ASSET_URL, json={"asset": []}, status=200)
+        exporter = RestClientMetrics("magen_stats_test").install()
+        RestClientApis.http_get_and_check_success(ASSET_URL)
+        RestClientApis.http_get_and_check_success(ASSET_URL)
+        histograms = exporter.histograms(host="localhost:5020")
+        route = "/magen/ingestion/v2/assets/asset/<id>/"
+        total = histograms[("localhost:5020", "GET", route, "total")]
+        self.assertEqual(total.count, 2)
+        self.assertEqual(total.labels["route"], route)
+        self.assertEqual(histograms[("localhost:5020", "GET", route, "retries")].sum, 0)
+        self.assertGreater(histograms[("localhost:5020", "GET", route, "bytes_in")].sum, 0)
+        exporter.uninstall()
+        RestClientApis.http_get_and_check_success(ASSET_URL)
+        self.assertEqual(total.count, 2)